@@ -801,6 +801,18 @@ class SavTool:
             except Exception as e:
                 logger.debug(f"清理运行时修改标签页时出错: {e}")
         
+        try:
+            from src.modules.save_analysis.sf.debug import shutdown_debugger
+            shutdown_debugger()
+        except ImportError:
+            pass
+        
+        try:
+            from src.modules.save_analysis.sf.file_viewer.async_loop import shutdown_shared_loop
+            shutdown_shared_loop()
+        except ImportError:
+            pass
+        
         try:
             self.root.destroy()
         except Exception as e:
@@ -542,12 +542,11 @@ class DevToolsConsoleWindow(ctk.CTkToplevel):
         try:
             self.output_textbox.configure(state="normal")
             
-            start_index = self.output_textbox.index("end-1c")
-            self.output_textbox.insert("end", text + "\n")
-            
             if self._tk_textbox and output_type in ("cmd", "result", "error", "undefined"):
-                end_index = self.output_textbox.index("end-1c")
-                self._tk_textbox.tag_add(output_type, start_index, end_index)
+                # 插入时直接附带标签，省去前后两次查询索引和单独的tag_add
+                self.output_textbox.insert("end", text + "\n", output_type)
+            else:
+                self.output_textbox.insert("end", text + "\n")
             
             self.output_textbox.configure(state="disabled")
             self.output_textbox.see("end")
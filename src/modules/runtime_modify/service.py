@@ -886,7 +886,8 @@ class RuntimeModifyService:
     async def inject_and_save_sf(
         self,
         ws_url: str,
-        edited_data: Dict[str, Any]
+        edited_data: Dict[str, Any],
+        current_data: Optional[Dict[str, Any]] = None
     ) -> Tuple[bool, Optional[str]]:
         """将编辑后的数据注入到游戏内存并保存
         
@@ -896,6 +897,8 @@ class RuntimeModifyService:
         Args:
             ws_url: WebSocket调试URL
             edited_data: 编辑后的数据字典（用户修改的部分）
+            current_data: 刚刚读取到的游戏内存数据（如 check_sf_changes 返回的快照），
+                提供时不再重复读取，省去一次往返
             
         Returns:
             (是否成功, 错误信息)
@@ -911,11 +914,12 @@ class RuntimeModifyService:
             return False, "Cannot inject empty data"
         
         try:
-            # 先读取当前游戏内存中的数据
-            current_data, read_error = await self.read_tyrano_variable_sf(ws_url)
-            if read_error:
-                logger.error(f"Failed to read current data before injection: {read_error}")
-                return False, f"Failed to read current data: {read_error}"
+            # 先读取当前游戏内存中的数据（调用方已提供快照时跳过）
+            if current_data is None:
+                current_data, read_error = await self.read_tyrano_variable_sf(ws_url)
+                if read_error:
+                    logger.error(f"Failed to read current data before injection: {read_error}")
+                    return False, f"Failed to read current data: {read_error}"
             
             if current_data is None:
                 logger.warning("Current data is None, cannot merge")
@@ -969,7 +973,7 @@ class RuntimeModifyService:
             original_data: 原始数据快照
             
         Returns:
-            (是否有变更, 变更信息字典)
+            (是否有变更, 变更信息字典)，读取成功时变更信息中的 current_data 为读取到的数据
         """
         if not ws_url:
             return False, {"changes_text": ""}
@@ -992,7 +996,7 @@ class RuntimeModifyService:
             current_json = json.dumps(current_data, sort_keys=True, ensure_ascii=False)
             
             if original_json == current_json:
-                return False, {"changes_text": ""}
+                return False, {"changes_text": "", "current_data": current_data}
             
             # 有变更，生成变更信息
             change_descriptions = []
@@ -1016,7 +1020,11 @@ class RuntimeModifyService:
                     change_descriptions.append(f"  {key}: {original_value} -> {current_value}")
             
             changes_text = "\n".join(change_descriptions) if change_descriptions else "Unknown changes detected"
-            return True, {"changes_text": changes_text, "changes": change_descriptions}
+            return True, {
+                "changes_text": changes_text,
+                "changes": change_descriptions,
+                "current_data": current_data
+            }
             
         except (TypeError, ValueError) as comparison_err:
             logger.exception("Error comparing sf data")
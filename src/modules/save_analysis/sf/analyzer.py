@@ -81,6 +81,8 @@ class SaveAnalyzer:
         self.translations = translations
         self.current_language = current_language
         self.window = parent
+        # 上次渲染时使用的语言，用于在语言切换后使渲染缓存失效
+        self._rendered_language = current_language
         
         # 初始化窗口宽度
         cached_width = self._calculate_initial_width()
@@ -224,6 +226,10 @@ class SaveAnalyzer:
         # 更新UI文本
         self._update_ui_texts()
         
+        if self._rendered_language != self.current_language:
+            self._rendered_language = self.current_language
+            self.data_renderer.invalidate_translations()
+        
         # 加载存档数据
         self.save_data = load_save_file(self.storage_dir)
         
@@ -231,14 +237,17 @@ class SaveAnalyzer:
             try:
                 self._display_save_info(self.save_data)
             except (KeyError, ValueError, TypeError, AttributeError) as e:
-                logger.error(f"Failed to display save info: {e}", exc_info=True)
+                # 调试器可用时由它输出一条包含状态和堆栈的记录，避免堆栈重复输出
                 if _debugger:
                     _debugger.log_display_error(e, self)
+                else:
+                    logger.error(f"Failed to display save info: {e}", exc_info=True)
                 # 不重新抛出异常，避免崩溃
             except Exception as e:
-                logger.error(f"Unexpected error displaying save info: {e}", exc_info=True)
                 if _debugger:
                     _debugger.log_display_error(e, self)
+                else:
+                    logger.error(f"Unexpected error displaying save info: {e}", exc_info=True)
                 raise
         else:
             self._show_save_file_not_found()
@@ -350,11 +359,14 @@ class SaveAnalyzer:
     def _try_incremental_update(self, save_data: Dict[str, Any]) -> bool:
         """尝试增量更新
         
+        增量更新由数据渲染器合并调度，连续多次刷新只会执行最后一次；
+        若渲染器判定需要完整重建，则在回调中回退到完整重建。
+        
         Args:
             save_data: 存档数据字典
             
         Returns:
-            是否成功进行增量更新
+            是否成功调度增量更新
         """
         try:
             computed_data = compute_shared_data(
@@ -364,33 +376,49 @@ class SaveAnalyzer:
                 self.TOTAL_NG_SCENE
             )
             is_fanatic_route = computed_data["is_fanatic_route"]
-            
-            is_initialized_ref = {'value': self._is_initialized}
-            success = self.data_renderer.update_incremental(
-                save_data,
-                computed_data,
-                is_fanatic_route,
-                self.scrollable_frame,
-                is_initialized_ref
-            )
-            self._is_initialized = is_initialized_ref['value']
-            
-            if success:
-                self.window.after_idle(
-                    lambda: self._update_scrollregion_callback("display_save_info")
-                )
-                self.window.after_idle(
-                    lambda: self._update_statistics_panel_safe(save_data)
-                )
-                return True
         except (KeyError, ValueError, TypeError) as e:
             logger.warning(f"Incremental update failed, falling back to full rebuild: {e}")
             self._is_initialized = False
-        except Exception as e:
-            logger.error(f"Unexpected error during incremental update: {e}", exc_info=True)
+            return False
+        
+        is_initialized_ref = {'value': self._is_initialized}
+        self.data_renderer.schedule_incremental_update(
+            save_data,
+            computed_data,
+            is_fanatic_route,
+            self.scrollable_frame,
+            is_initialized_ref,
+            lambda success: self._on_incremental_update_done(save_data, is_initialized_ref, success)
+        )
+        return True
+    
+    def _on_incremental_update_done(
+        self,
+        save_data: Dict[str, Any],
+        is_initialized_ref: Dict[str, bool],
+        success: bool
+    ) -> None:
+        """增量更新完成后的回调
+        
+        Args:
+            save_data: 存档数据字典
+            is_initialized_ref: 初始化状态引用字典
+            success: 增量更新是否成功
+        """
+        self._is_initialized = is_initialized_ref['value']
+        
+        if not success:
             self._is_initialized = False
+            if self._validate_scrollable_frame():
+                self._rebuild_all_sections(save_data)
+            return
         
-        return False
+        self.window.after_idle(
+            lambda: self._update_scrollregion_callback("display_save_info")
+        )
+        self.window.after_idle(
+            lambda: self._update_statistics_panel_safe(save_data)
+        )
     
     def _rebuild_all_sections(self, save_data: Dict[str, Any]) -> None:
         """完整重建所有sections
@@ -398,6 +426,9 @@ class SaveAnalyzer:
         Args:
             save_data: 存档数据字典
         """
+        # 丢弃尚未执行的增量更新，避免其作用于重建后的widget
+        self.data_renderer.cancel_pending_update()
+        
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
         
@@ -412,11 +443,15 @@ class SaveAnalyzer:
             )
             is_fanatic_route = computed_data["is_fanatic_route"]
         except (KeyError, ValueError, TypeError) as e:
-            logger.error(f"Failed to compute shared data: {e}", exc_info=True)
             if _debugger:
                 _debugger.log_display_error(e, self)
+            else:
+                logger.error(f"Failed to compute shared data: {e}", exc_info=True)
             return
         
+        if _debugger:
+            _debugger.reset_section_errors()
+        
         rendered_count = self.data_renderer.render_all_sections(
             self.scrollable_frame,
             save_data,
@@ -425,6 +460,7 @@ class SaveAnalyzer:
         )
         
         if _debugger:
+            _debugger.flush_section_errors()
             _debugger.log_sections_rendered(rendered_count)
         
         # 重新绑定滚轮事件到新创建的widget
@@ -5,9 +5,12 @@
 """
 
 import logging
+from dataclasses import dataclass
+from functools import partial
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any, Optional, Callable, List, Tuple
+import tkinter.font as tkfont
+from typing import Dict, Any, Optional, Callable, Tuple
 from src.utils.styles import get_cjk_font, Colors
 from src.constants import LATEST_GAME_PATCH_AT_BUILD
 
@@ -19,7 +22,8 @@ from .ui_components import (
     create_section_with_button,
     add_info_line,
     add_list_info,
-    add_info_line_with_tooltip
+    add_info_line_with_tooltip,
+    HINT_FONT_SIZE
 )
 from .save_data_service import format_field_value
 from .config import get_field_configs_with_callbacks
@@ -33,7 +37,7 @@ HINT_WRAPLENGTH_RATIO = 0.85
 SECTION_KEY_FANATIC_RELATED = "fanatic_related"
 SECTION_KEY_CHARACTER_INFO = "character_info"
 
-DEFAULT_SECTION_ORDER = [
+DEFAULT_SECTION_ORDER: Tuple[str, ...] = (
     "endings_statistics",
     "stickers_statistics",
     "characters_statistics",
@@ -41,16 +45,147 @@ DEFAULT_SECTION_ORDER = [
     "game_statistics",
     SECTION_KEY_CHARACTER_INFO,
     "other_info"
-]
+)
+
+# 按路线预先展开的渲染顺序：狂信徒路线时置顶，否则插入到character_info之前
+_CHARACTER_INFO_INDEX = DEFAULT_SECTION_ORDER.index(SECTION_KEY_CHARACTER_INFO)
+FANATIC_ROUTE_SECTION_ORDER: Tuple[str, ...] = (SECTION_KEY_FANATIC_RELATED, *DEFAULT_SECTION_ORDER)
+NORMAL_ROUTE_SECTION_ORDER: Tuple[str, ...] = (
+    *DEFAULT_SECTION_ORDER[:_CHARACTER_INFO_INDEX],
+    SECTION_KEY_FANATIC_RELATED,
+    *DEFAULT_SECTION_ORDER[_CHARACTER_INFO_INDEX:]
+)
 
 # UI 布局常量
 SECTION_PADDING_X = 10
 SECTION_PADDING_Y = 5
 
+# 提示文本中的游戏补丁日期占位符
+PATCH_DATE_PLACEHOLDER = "[GAMEPATCH_DATE]"
+
+# 增量更新合并窗口（毫秒）
+INCREMENTAL_UPDATE_DEBOUNCE_MS = 50
+
+# 字段渲染方式（由字段配置预先计算，渲染时直接按类型分派）
+FIELD_KIND_STATIC = 0
+FIELD_KIND_TOOLTIP = 1
+FIELD_KIND_LIST = 2
+FIELD_KIND_DYNAMIC = 3
+FIELD_KIND_DYNAMIC_LIST = 4
+
+
+@dataclass(frozen=True, slots=True)
+class FieldPlan:
+    """预先解析的字段渲染计划
+    
+    Attributes:
+        kind: 字段渲染方式（FIELD_KIND_*）
+        field_config: 原始字段配置（用于格式化字段值）
+        label_key: 标签的翻译键
+        widget_key: widget标识键
+        var_name: 变量名
+        text_color: 字段文字颜色，None表示沿用section颜色
+        tooltip_key: 提示信息的翻译键
+        tooltip_optional: 提示文本为空时是否退化为普通信息行
+    """
+    kind: int
+    field_config: Dict[str, Any]
+    label_key: str
+    widget_key: Optional[str]
+    var_name: Optional[str]
+    text_color: Optional[str]
+    tooltip_key: Optional[str]
+    tooltip_optional: bool
+
+
+def _build_field_plan(field_config: Dict[str, Any]) -> Optional[FieldPlan]:
+    """根据字段配置构建渲染计划
+    
+    Args:
+        field_config: 字段配置字典
+        
+    Returns:
+        字段渲染计划，缺少必需键时返回None
+    """
+    label_key = field_config.get("label_key")
+    if not label_key or not isinstance(label_key, str):
+        logger.warning(f"Skipping field without valid label_key: {field_config!r}")
+        return None
+    
+    widget_key = field_config.get("widget_key")
+    if widget_key is not None and not isinstance(widget_key, str):
+        logger.warning(f"Skipping field {label_key} with non-string widget_key: {widget_key!r}")
+        return None
+    
+    if field_config.get("is_dynamic"):
+        # 动态字段在增量更新时按widget_key查找，缺少时无法更新
+        if not widget_key:
+            logger.warning(f"Skipping dynamic field {label_key} without widget_key")
+            return None
+        kind = FIELD_KIND_DYNAMIC_LIST if field_config.get("is_list") else FIELD_KIND_DYNAMIC
+    elif field_config.get("has_tooltip"):
+        kind = FIELD_KIND_TOOLTIP
+    elif field_config.get("is_list"):
+        kind = FIELD_KIND_LIST
+    else:
+        kind = FIELD_KIND_STATIC
+    
+    return FieldPlan(
+        kind=kind,
+        field_config=field_config,
+        label_key=label_key,
+        widget_key=widget_key,
+        var_name=field_config.get("var_name"),
+        text_color=field_config.get("text_color"),
+        tooltip_key=field_config.get("tooltip_key"),
+        tooltip_optional=bool(field_config.get("tooltip_optional"))
+    )
+
+
+# 提示标签的命名字体（首次使用时创建，之后所有提示标签共用同一个Tk字体对象）
+_HINT_FONT: Optional[tkfont.Font] = None
+
+
+def _get_hint_font(master: tk.Widget) -> tkfont.Font:
+    """获取提示标签使用的字体
+    
+    传入字体元组时Tk会为每个widget重新解析字体描述，
+    共用一个命名字体后只需解析一次。
+    
+    Args:
+        master: 用于创建字体的widget（仅首次调用时使用）
+        
+    Returns:
+        字体对象
+    """
+    global _HINT_FONT
+    if _HINT_FONT is None:
+        family, size = get_cjk_font(HINT_FONT_SIZE)[:2]
+        _HINT_FONT = tkfont.Font(root=master, family=family, size=size)
+    return _HINT_FONT
+
 
 class DataRenderer:
     """负责数据渲染的类"""
     
+    __slots__ = (
+        'widget_manager',
+        'cached_width',
+        'translation_func',
+        '_get_field_configs',
+        '_pending_update_args',
+        '_update_after_id',
+        '_update_timer_widget',
+        '_last_is_fanatic_route',
+        '_last_fanatic_color',
+        '_tr_cache',
+        '_alive_cache',
+        '_last_values',
+        '_configs_cache',
+        '_field_plans',
+        '_fanatic_widget_keys'
+    )
+    
     def __init__(
         self,
         widget_manager: WidgetManager,
@@ -70,6 +205,128 @@ class DataRenderer:
         self.cached_width = cached_width
         self.translation_func = translation_func
         self._get_field_configs = get_field_configs_func or get_field_configs_with_callbacks
+        
+        # 增量更新合并状态：只保留最后一次请求的参数
+        self._pending_update_args: Optional[Tuple[Any, ...]] = None
+        self._update_after_id: Optional[str] = None
+        self._update_timer_widget: Optional[tk.Widget] = None
+        
+        # 上次应用到狂信徒section的路线状态，未变化时跳过颜色和位置调整
+        self._last_is_fanatic_route: Optional[bool] = None
+        # 上次应用到狂信徒section的文字颜色，相同时跳过逐个widget的config
+        self._last_fanatic_color: Optional[str] = None
+        
+        # 本轮渲染内已处理占位符的翻译文本
+        self._tr_cache: Dict[str, str] = {}
+        # 本轮渲染/更新内widget存活检查结果（仅在一轮处理期间有效，之外为None）
+        self._alive_cache: Optional[Dict[int, bool]] = None
+        
+        # 每个字段上次写入的 (值, 标签, 提示) 文本，未变化时跳过写入
+        self._last_values: Dict[str, Tuple[str, str, str]] = {}
+        
+        # 字段配置及按section预先解析的字段渲染计划
+        self._configs_cache: Optional[Dict[str, Any]] = None
+        self._field_plans: Dict[str, Tuple[FieldPlan, ...]] = {}
+        # 狂信徒section中带widget_key的字段键（由字段渲染计划派生）
+        self._fanatic_widget_keys: Optional[Tuple[str, ...]] = None
+    
+    def _field_configs(self) -> Dict[str, Any]:
+        """获取字段配置（首次调用时获取并缓存）
+        
+        字段配置只包含翻译键和回调工厂，与语言和存档数据无关，
+        因此在渲染器的生命周期内只需获取一次。
+        
+        Returns:
+            包含所有section配置的字典
+        """
+        if self._configs_cache is None:
+            self._configs_cache = self._get_field_configs()
+        return self._configs_cache
+    
+    def _get_field_plans(
+        self,
+        section_key: str,
+        configs: Optional[Dict[str, Any]] = None
+    ) -> Tuple[FieldPlan, ...]:
+        """获取section的字段渲染计划（按section缓存）
+        
+        Args:
+            section_key: section的键名
+            configs: 调用方已获取的字段配置（可选，省略时自动获取）
+            
+        Returns:
+            字段渲染计划元组
+        """
+        plans = self._field_plans.get(section_key)
+        if plans is None:
+            if configs is None:
+                configs = self._field_configs()
+            section_config = configs.get(section_key) or {}
+            plans = tuple(
+                plan
+                for plan in map(_build_field_plan, section_config.get("fields", []))
+                if plan is not None
+            )
+            self._field_plans[section_key] = plans
+        return plans
+    
+    def reset_update_state(self) -> None:
+        """清除增量更新的缓存状态
+        
+        语言切换等会改变显示文本、但不改变存档数据的情况下调用，
+        保证下一次增量更新完整执行。
+        """
+        self._last_values.clear()
+    
+    def invalidate_translations(self) -> None:
+        """清除翻译缓存（语言切换后调用）
+        
+        同时清除增量更新状态，使下一次更新重新写入所有文本。
+        """
+        self._tr_cache.clear()
+        self.reset_update_state()
+    
+    def _alive(self, widget: Optional[tk.Widget]) -> bool:
+        """检查widget是否存在（一轮处理内缓存winfo_exists结果）
+        
+        Tk是单线程的，一轮渲染/更新期间已检查过的widget不会被其他代码销毁，
+        因此同一widget只需向Tcl查询一次。
+        
+        Args:
+            widget: 要检查的widget
+            
+        Returns:
+            widget存在返回True，否则返回False
+        """
+        if widget is None:
+            return False
+        cache = self._alive_cache
+        if cache is None:
+            return bool(widget.winfo_exists())
+        widget_id = id(widget)
+        alive = cache.get(widget_id)
+        if alive is None:
+            alive = cache[widget_id] = bool(widget.winfo_exists())
+        return alive
+    
+    def _tr(self, key: str) -> str:
+        """翻译文本并替换补丁日期占位符（结果在本轮渲染内缓存）
+        
+        模块内所有翻译都经由此方法，同一轮渲染中每个键只翻译一次。
+        
+        Args:
+            key: 翻译键
+            
+        Returns:
+            翻译后的文本
+        """
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self.translation_func(key)
+            if PATCH_DATE_PLACEHOLDER in text:
+                text = text.replace(PATCH_DATE_PLACEHOLDER, LATEST_GAME_PATCH_AT_BUILD)
+            self._tr_cache[key] = text
+        return text
     
     def render_section(
         self,
@@ -91,10 +348,10 @@ class DataRenderer:
         Returns:
             创建的section容器，如果失败则返回None
         """
-        if parent is None or not parent.winfo_exists():
+        if not self._alive(parent):
             return None
         
-        configs = self._get_field_configs()
+        configs = self._field_configs()
         config = configs.get(section_key)
         if not config:
             return None
@@ -113,8 +370,8 @@ class DataRenderer:
                 
                 section = create_section_with_button(
                     parent,
-                    self.translation_func(config["title_key"]),
-                    self.translation_func(config.get("button_text_key", "view_requirements")),
+                    self._tr(config["title_key"]),
+                    self._tr(config.get("button_text_key", "view_requirements")),
                     self.widget_manager,
                     self.cached_width,
                     button_command,
@@ -124,7 +381,7 @@ class DataRenderer:
             else:
                 section = create_section(
                     parent,
-                    self.translation_func(config["title_key"]),
+                    self._tr(config["title_key"]),
                     self.widget_manager,
                     self.cached_width,
                     config.get("bg_color"),
@@ -132,7 +389,7 @@ class DataRenderer:
                     config["title_key"]
                 )
             
-            if section is None or not section.winfo_exists():
+            if not self._alive(section):
                 return None
                 
         except (KeyError, AttributeError, tk.TclError) as e:
@@ -141,142 +398,124 @@ class DataRenderer:
         
         self.widget_manager.register_section(section_key, section)
         
+        # 绑定本section共用的参数，各调用点只传字段相关的参数
+        add_line = partial(
+            add_info_line,
+            section,
+            widget_manager=self.widget_manager,
+            cached_width=self.cached_width,
+            translation_func=self._tr
+        )
+        add_tooltip_line = partial(
+            add_info_line_with_tooltip,
+            section,
+            widget_manager=self.widget_manager,
+            cached_width=self.cached_width,
+            translation_func=self._tr
+        )
+        add_list = partial(
+            add_list_info,
+            section,
+            cached_width=self.cached_width,
+            translation_func=self._tr
+        )
+        
         fields_rendered = 0
-        for field_config in config.get("fields", []):
-            try:
+        try:
+            for plan in self._get_field_plans(section_key, configs):
                 value = format_field_value(
-                    field_config, 
+                    plan.field_config, 
                     save_data, 
                     computed_data, 
-                    self.translation_func
+                    self._tr
                 )
-                field_text_color = field_config.get("text_color")
+                field_text_color = plan.text_color
                 if field_text_color is None:
                     field_text_color = text_color
                 
-                widget_key = field_config.get("widget_key")
+                kind = plan.kind
+                widget_key = plan.widget_key
+                label = self._tr(plan.label_key)
                 
-                if field_config.get("is_dynamic"):
-                    if field_config.get("is_list"):
-                        if value:
-                            add_list_info(
-                                section, 
-                                self.translation_func(field_config["label_key"]), 
-                                value,
-                                self.cached_width,
-                                self.translation_func
-                            )
-                            self.widget_manager.register_dynamic_widget(widget_key, {
-                                'section': section,
-                                'label': self.translation_func(field_config["label_key"]),
-                                'data_key': widget_key,
-                                'is_list': True
-                            })
-                        else:
-                            add_info_line(
-                                section, 
-                                self.translation_func(field_config["label_key"]), 
-                                self.translation_func("none"), 
-                                self.widget_manager,
-                                self.cached_width,
-                                self.translation_func,
-                                None, 
-                                widget_key
-                            )
-                            self.widget_manager.register_dynamic_widget(widget_key, {
-                                'section': section,
-                                'label': self.translation_func(field_config["label_key"]),
-                                'data_key': widget_key,
-                                'is_list': False
-                            })
+                if kind == FIELD_KIND_DYNAMIC_LIST:
+                    if value:
+                        list_widget = add_list(label, value)
+                        self.widget_manager.register_list_widget(widget_key, list_widget)
+                        self.widget_manager.register_dynamic_widget(widget_key, {
+                            'section': section,
+                            'label': label,
+                            'data_key': widget_key,
+                            'is_list': True,
+                            'items': tuple(value)
+                        })
                     else:
-                        add_info_line(
-                            section, 
-                            self.translation_func(field_config["label_key"]), 
-                            value, 
-                            self.widget_manager,
-                            self.cached_width,
-                            self.translation_func,
-                            field_config.get("var_name"), 
-                            widget_key, 
-                            field_text_color
+                        add_line(
+                            label,
+                            self._tr("none"),
+                            widget_key=widget_key
                         )
                         self.widget_manager.register_dynamic_widget(widget_key, {
                             'section': section,
-                            'label': self.translation_func(field_config["label_key"]),
-                            'data_key': widget_key
+                            'label': label,
+                            'data_key': widget_key,
+                            'is_list': False,
+                            'items': ()
                         })
-                elif field_config.get("has_tooltip"):
-                    tooltip_key = field_config.get("tooltip_key")
-                    tooltip_text = self.translation_func(tooltip_key) if tooltip_key else ""
-                    # 替换占位符
-                    if "[GAMEPATCH_DATE]" in tooltip_text:
-                        tooltip_text = tooltip_text.replace("[GAMEPATCH_DATE]", LATEST_GAME_PATCH_AT_BUILD)
-                    if not tooltip_text and field_config.get("tooltip_optional"):
-                        add_info_line(
-                            section, 
-                            self.translation_func(field_config["label_key"]), 
-                            value, 
-                            self.widget_manager,
-                            self.cached_width,
-                            self.translation_func,
-                            field_config.get("var_name"), 
-                            widget_key, 
-                            field_text_color
+                elif kind == FIELD_KIND_DYNAMIC:
+                    add_line(
+                        label,
+                        value,
+                        var_name=plan.var_name,
+                        widget_key=widget_key,
+                        text_color=field_text_color
+                    )
+                    self.widget_manager.register_dynamic_widget(widget_key, {
+                        'section': section,
+                        'label': label,
+                        'data_key': widget_key
+                    })
+                elif kind == FIELD_KIND_TOOLTIP:
+                    tooltip_text = self._tr(plan.tooltip_key) if plan.tooltip_key else ""
+                    if not tooltip_text and plan.tooltip_optional:
+                        add_line(
+                            label,
+                            value,
+                            var_name=plan.var_name,
+                            widget_key=widget_key,
+                            text_color=field_text_color
                         )
                         fields_rendered += 1
                         continue
                     
-                    add_info_line_with_tooltip(
-                        section,
-                        self.translation_func(field_config["label_key"]),
+                    add_tooltip_line(
+                        label,
                         value,
                         tooltip_text,
-                        self.widget_manager,
-                        self.cached_width,
-                        self.translation_func,
-                        field_config.get("var_name"),
-                        widget_key,
-                        field_text_color
-                    )
-                elif field_config.get("is_list"):
-                    add_list_info(
-                        section, 
-                        self.translation_func(field_config["label_key"]), 
-                        value,
-                        self.cached_width,
-                        self.translation_func
+                        var_name=plan.var_name,
+                        widget_key=widget_key,
+                        text_color=field_text_color
                     )
+                elif kind == FIELD_KIND_LIST:
+                    add_list(label, value)
                 else:
-                    add_info_line(
-                        section,
-                        self.translation_func(field_config["label_key"]),
+                    add_line(
+                        label,
                         value,
-                        self.widget_manager,
-                        self.cached_width,
-                        self.translation_func,
-                        field_config.get("var_name"),
-                        widget_key,
-                        field_text_color
+                        var_name=plan.var_name,
+                        widget_key=widget_key,
+                        text_color=field_text_color
                     )
                 fields_rendered += 1
-            except (KeyError, AttributeError, ValueError) as e:
-                # 跳过有问题的字段，继续渲染其他字段
-                continue
-        
-        # 添加提示标签
-        if config.get("has_hint"):
-            hint_key = config.get("hint_key")
-            if hint_key:
-                try:
-                    hint_text = self.translation_func(hint_key)
-                    # 替换占位符
-                    if "[GAMEPATCH_DATE]" in hint_text:
-                        hint_text = hint_text.replace("[GAMEPATCH_DATE]", LATEST_GAME_PATCH_AT_BUILD)
+            
+            # 添加提示标签
+            if config.get("has_hint"):
+                hint_key = config.get("hint_key")
+                if hint_key:
+                    hint_text = self._tr(hint_key)
                     hint_label = ttk.Label(
                         section, 
                         text=hint_text, 
-                        font=get_cjk_font(9), 
+                        font=_get_hint_font(section), 
                         foreground="gray",
                         wraplength=int(self.cached_width * HINT_WRAPLENGTH_RATIO),
                         justify="left"
@@ -286,116 +525,209 @@ class DataRenderer:
                         'label': hint_label,
                         'text_key': hint_key
                     })
-                except (AttributeError, tk.TclError):
-                    pass
+        except tk.TclError as e:
+            # 单个section内的widget错误不影响其他section
+            logger.warning(f"Failed to render fields of section {section_key}: {e}")
         
         return section
     
-    def _build_section_order(self, is_fanatic_route: bool) -> List[Tuple[str, bool] | str]:
-        """构建section渲染顺序
+    @staticmethod
+    def _build_section_order(is_fanatic_route: bool) -> Tuple[str, ...]:
+        """获取section渲染顺序
         
         Args:
             is_fanatic_route: 是否为狂信徒路线
             
         Returns:
-            section顺序列表，每个元素为section键名或(键名, 条件)元组
+            按渲染顺序排列的section键名
         """
-        fanatic_section_item: Tuple[str, bool] = (SECTION_KEY_FANATIC_RELATED, True)
-        
-        if is_fanatic_route:
-            return [fanatic_section_item, *DEFAULT_SECTION_ORDER]
-        
-        # 非狂信徒路线：插入到character_info之前
-        if SECTION_KEY_CHARACTER_INFO not in DEFAULT_SECTION_ORDER:
-            logger.error(
-                f"Configuration error: {SECTION_KEY_CHARACTER_INFO} not found in DEFAULT_SECTION_ORDER. "
-                "Falling back to appending fanatic section at the end."
-            )
-            return [*DEFAULT_SECTION_ORDER, fanatic_section_item]
-        
-        character_info_index = DEFAULT_SECTION_ORDER.index(SECTION_KEY_CHARACTER_INFO)
-        return [
-            *DEFAULT_SECTION_ORDER[:character_info_index],
-            fanatic_section_item,
-            *DEFAULT_SECTION_ORDER[character_info_index:]
-        ]
+        return FANATIC_ROUTE_SECTION_ORDER if is_fanatic_route else NORMAL_ROUTE_SECTION_ORDER
     
-    def _render_section_item(
+    def render_all_sections(
         self,
-        section_item: Tuple[str, bool] | str,
         parent: tk.Widget,
         save_data: Dict[str, Any],
         computed_data: Dict[str, Any],
         is_fanatic_route: bool
-    ) -> Optional[tk.Frame]:
-        """渲染单个section项
+    ) -> int:
+        """渲染所有section
         
         Args:
-            section_item: section项（键名或(键名, 条件)元组）
             parent: 父容器
             save_data: 存档数据
             computed_data: 计算后的共享数据
             is_fanatic_route: 是否为狂信徒路线
             
         Returns:
-            渲染的section，失败返回None
+            成功渲染的section数量
         """
-        if isinstance(section_item, tuple):
-            section_key, should_render = section_item
-            if not should_render:
-                return None
-        else:
-            section_key = section_item
+        if parent is None or not parent.winfo_exists():
+            return 0
         
-        return self.render_section(
-            section_key,
-            parent,
-            save_data,
-            computed_data,
-            is_fanatic_route
-        )
+        # 每轮渲染重新翻译，保证语言切换后文本正确
+        self._tr_cache.clear()
+        self.reset_update_state()
+        
+        section_order = self._build_section_order(is_fanatic_route)
+        rendered_count = 0
+        # 完整渲染时狂信徒section已按路线放在正确位置
+        self._last_is_fanatic_route = is_fanatic_route
+        self._last_fanatic_color = FANATIC_ROUTE_TEXT_COLOR if is_fanatic_route else None
+        
+        # 构建期间冻结容器布局，所有section创建完后统一重排一次
+        restore_layout = self._freeze_container(parent)
+        self._alive_cache = {}
+        try:
+            for section_key in section_order:
+                try:
+                    section = self.render_section(
+                        section_key,
+                        parent,
+                        save_data,
+                        computed_data,
+                        is_fanatic_route
+                    )
+                    rendered_count += section is not None
+                except (KeyError, AttributeError, tk.TclError) as e:
+                    # 单个section渲染失败不影响其他section
+                    logger.warning(f"Failed to render section {section_key}: {e}")
+                    continue
+        finally:
+            self._alive_cache = None
+            restore_layout()
+        
+        return rendered_count
     
-    def render_all_sections(
+    @staticmethod
+    def _freeze_container(parent: tk.Widget) -> Callable[[], None]:
+        """暂停容器的几何重排，返回用于恢复布局的函数
+        
+        pack/grid管理的容器会先从布局中移除，构建完成后按原参数恢复；
+        嵌入画布等其他情况只关闭pack传播，避免每个子组件pack时容器反复调整尺寸。
+        恢复函数最后只执行一次update_idletasks。
+        
+        Args:
+            parent: 父容器
+            
+        Returns:
+            恢复布局的函数
+        """
+        try:
+            manager = parent.winfo_manager()
+            if manager == "pack":
+                pack_options = parent.pack_info()
+                # 记录后一个兄弟组件，恢复时保持原有的pack顺序
+                siblings = parent.master.pack_slaves()
+                index = siblings.index(parent)
+                if index + 1 < len(siblings):
+                    pack_options["before"] = siblings[index + 1]
+                parent.pack_forget()
+                
+                def restore_geometry() -> None:
+                    parent.pack(**pack_options)
+            elif manager == "grid":
+                parent.grid_remove()
+                
+                def restore_geometry() -> None:
+                    parent.grid()
+            else:
+                propagate = parent.pack_propagate()
+                parent.pack_propagate(False)
+                
+                def restore_geometry() -> None:
+                    parent.pack_propagate(propagate)
+        except tk.TclError as e:
+            logger.debug(f"Failed to freeze container layout: {e}")
+            return lambda: None
+        
+        def restore() -> None:
+            try:
+                if not parent.winfo_exists():
+                    return
+                restore_geometry()
+                parent.update_idletasks()
+            except tk.TclError as e:
+                logger.warning(f"Failed to restore container layout: {e}")
+        
+        return restore
+    
+    def schedule_incremental_update(
         self,
-        parent: tk.Widget,
         save_data: Dict[str, Any],
         computed_data: Dict[str, Any],
-        is_fanatic_route: bool
-    ) -> int:
-        """渲染所有section
+        is_fanatic_route: bool,
+        scrollable_frame: tk.Widget,
+        is_initialized_ref: Dict[str, bool],
+        on_complete: Optional[Callable[[bool], None]] = None
+    ) -> None:
+        """调度一次增量更新，短时间内的多次请求合并为一次渲染
+        
+        只保留最后一次请求的参数，在合并窗口结束后执行 update_incremental。
         
         Args:
-            parent: 父容器
             save_data: 存档数据
             computed_data: 计算后的共享数据
             is_fanatic_route: 是否为狂信徒路线
-            
-        Returns:
-            成功渲染的section数量
+            scrollable_frame: 可滚动frame（同时作为定时器的宿主widget）
+            is_initialized_ref: 初始化状态引用字典
+            on_complete: 更新完成后的回调，参数为 update_incremental 的返回值
         """
-        if parent is None or not parent.winfo_exists():
-            return 0
+        self._pending_update_args = (
+            save_data,
+            computed_data,
+            is_fanatic_route,
+            scrollable_frame,
+            is_initialized_ref,
+            on_complete
+        )
+        if self._update_after_id is not None:
+            return
         
-        section_order = self._build_section_order(is_fanatic_route)
-        rendered_count = 0
+        self._update_timer_widget = scrollable_frame
+        self._update_after_id = scrollable_frame.after(
+            INCREMENTAL_UPDATE_DEBOUNCE_MS,
+            self._flush_incremental_update
+        )
+    
+    def cancel_pending_update(self) -> None:
+        """取消尚未执行的增量更新（完整重建前调用）"""
+        after_id = self._update_after_id
+        timer_widget = self._update_timer_widget
+        self._update_after_id = None
+        self._update_timer_widget = None
+        self._pending_update_args = None
         
-        for section_item in section_order:
-            try:
-                section = self._render_section_item(
-                    section_item,
-                    parent,
-                    save_data,
-                    computed_data,
-                    is_fanatic_route
-                )
-                if section is not None:
-                    rendered_count += 1
-            except (KeyError, AttributeError, tk.TclError) as e:
-                # 单个section渲染失败不影响其他section
-                logger.warning(f"Failed to render section {section_item}: {e}")
-                continue
+        if after_id is None or timer_widget is None:
+            return
+        try:
+            timer_widget.after_cancel(after_id)
+        except tk.TclError:
+            pass
+    
+    def _flush_incremental_update(self) -> None:
+        """执行合并后的增量更新"""
+        self._update_after_id = None
+        self._update_timer_widget = None
+        args = self._pending_update_args
+        self._pending_update_args = None
+        if args is None:
+            return
         
-        return rendered_count
+        *update_args, on_complete = args
+        is_initialized_ref = update_args[-1]
+        try:
+            success = self.update_incremental(*update_args)
+        except (KeyError, ValueError, TypeError, tk.TclError) as e:
+            logger.warning(f"Incremental update failed, falling back to full rebuild: {e}")
+            is_initialized_ref['value'] = False
+            success = False
+        except Exception as e:
+            logger.error(f"Unexpected error during incremental update: {e}", exc_info=True)
+            is_initialized_ref['value'] = False
+            success = False
+        
+        if on_complete is not None:
+            on_complete(success)
     
     def update_incremental(
         self,
@@ -421,56 +753,73 @@ class DataRenderer:
             is_initialized_ref['value'] = False
             return False
         
-        # 检查第一个widget是否有效
-        first_key = next(iter(self.widget_manager._widget_map), None)
-        if first_key:
-            widget_info = self.widget_manager.get_widget(first_key)
-            if widget_info:
-                value_widget = widget_info.get('value_widget')
-                if not value_widget or not value_widget.winfo_exists():
-                    is_initialized_ref['value'] = False
-                    return False
-        
-        # 更新狂信徒section的颜色和位置
-        fanatic_section = self.widget_manager.get_section(SECTION_KEY_FANATIC_RELATED)
-        if not fanatic_section or not fanatic_section.winfo_exists():
-            is_initialized_ref['value'] = False
-            return False
-        
-        self._update_fanatic_section_colors_and_position(
-            fanatic_section,
-            scrollable_frame,
-            is_fanatic_route
-        )
-        
-        # 更新动态widget
-        self._update_dynamic_widgets(computed_data)
-        
-        # 更新所有字段
-        configs = self._get_field_configs()
-        self._update_all_fields(configs, save_data, computed_data, is_fanatic_route, is_initialized_ref)
-        
-        return True
+        self._alive_cache = {}
+        try:
+            self._tr_cache.clear()
+            
+            # 检查第一个widget是否有效
+            first_key = next(iter(self.widget_manager._widget_map), None)
+            if first_key:
+                widget_info = self.widget_manager.get_widget(first_key)
+                if widget_info:
+                    value_widget = widget_info.get('value_widget')
+                    if not self._alive(value_widget):
+                        is_initialized_ref['value'] = False
+                        return False
+            
+            # 更新狂信徒section的颜色和位置
+            fanatic_section = self.widget_manager.get_section(SECTION_KEY_FANATIC_RELATED)
+            if not self._alive(fanatic_section):
+                is_initialized_ref['value'] = False
+                return False
+            
+            # 本轮更新只获取一次字段配置，传给各个子步骤
+            configs = self._field_configs()
+            
+            self._update_fanatic_section_colors_and_position(
+                fanatic_section,
+                scrollable_frame,
+                is_fanatic_route,
+                configs
+            )
+            
+            # 更新动态widget
+            self._update_dynamic_widgets(computed_data)
+            
+            # 更新所有字段
+            self._update_all_fields(configs, save_data, computed_data, is_fanatic_route, is_initialized_ref)
+            
+            return True
+        finally:
+            self._alive_cache = None
     
-    def _update_fanatic_section_colors(self, fanatic_section: tk.Widget) -> None:
+    def _update_fanatic_section_colors(
+        self,
+        fanatic_section: tk.Widget,
+        configs: Dict[str, Any]
+    ) -> None:
         """更新狂信徒section的颜色（仅在狂信徒路线时）
         
         Args:
             fanatic_section: 狂信徒section的widget
+            configs: 字段配置
         """
+        if self._last_fanatic_color == FANATIC_ROUTE_TEXT_COLOR:
+            return
+        
         title_widget_info = self.widget_manager.get_section_title(SECTION_KEY_FANATIC_RELATED)
         if title_widget_info:
             title_label = title_widget_info.get('title_label')
-            if title_label and title_label.winfo_exists():
+            if self._alive(title_label):
                 title_label.config(foreground=FANATIC_ROUTE_TEXT_COLOR)
         
-        configs = self._get_field_configs()
-        fanatic_config = configs.get(SECTION_KEY_FANATIC_RELATED, {})
-        fanatic_widget_keys = [
-            field.get("widget_key")
-            for field in fanatic_config.get("fields", [])
-            if field.get("widget_key")
-        ]
+        fanatic_widget_keys = self._fanatic_widget_keys
+        if fanatic_widget_keys is None:
+            fanatic_widget_keys = self._fanatic_widget_keys = tuple(
+                plan.widget_key
+                for plan in self._get_field_plans(SECTION_KEY_FANATIC_RELATED, configs)
+                if plan.widget_key
+            )
         
         for widget_key in fanatic_widget_keys:
             widget_info = self.widget_manager.get_widget(widget_key)
@@ -480,13 +829,14 @@ class DataRenderer:
             value_widget = widget_info.get('value_widget')
             label_widget = widget_info.get('label_widget')
             
-            if value_widget and value_widget.winfo_exists():
+            if self._alive(value_widget):
                 value_widget.config(foreground=FANATIC_ROUTE_TEXT_COLOR)
-            if label_widget and label_widget.winfo_exists():
+            if self._alive(label_widget):
                 label_widget.config(foreground=FANATIC_ROUTE_TEXT_COLOR)
         
-        # 递归更新所有Label的颜色
-        self._update_widget_colors_recursive(fanatic_section, FANATIC_ROUTE_TEXT_COLOR)
+        # 更新section内所有Label的颜色
+        self._update_label_colors(SECTION_KEY_FANATIC_RELATED, fanatic_section, FANATIC_ROUTE_TEXT_COLOR)
+        self._last_fanatic_color = FANATIC_ROUTE_TEXT_COLOR
     
     def _reposition_section_frame(
         self,
@@ -529,7 +879,7 @@ class DataRenderer:
             scrollable_frame: 可滚动frame容器
             is_fanatic_route: 是否为狂信徒路线
         """
-        if not scrollable_frame.winfo_exists():
+        if not self._alive(scrollable_frame):
             return
         
         children = list(scrollable_frame.winfo_children())
@@ -551,7 +901,7 @@ class DataRenderer:
             return
         
         character_info_frame = getattr(character_info_section, '_section_frame', None)
-        if character_info_frame is None or not character_info_frame.winfo_exists():
+        if not self._alive(character_info_frame):
             # character_info frame无效，降级到末尾
             if children[-1] != section_frame:
                 self._reposition_section_frame(section_frame, None, scrollable_frame)
@@ -574,7 +924,8 @@ class DataRenderer:
         self,
         fanatic_section: tk.Widget,
         scrollable_frame: tk.Widget,
-        is_fanatic_route: bool
+        is_fanatic_route: bool,
+        configs: Dict[str, Any]
     ) -> None:
         """更新狂信徒section的颜色和位置
         
@@ -582,28 +933,64 @@ class DataRenderer:
             fanatic_section: 狂信徒section的widget
             scrollable_frame: 可滚动frame
             is_fanatic_route: 是否为狂信徒路线
+            configs: 字段配置
         """
+        if self._last_is_fanatic_route == is_fanatic_route:
+            return
+        
         section_frame = getattr(fanatic_section, '_section_frame', None)
-        if section_frame is None or not section_frame.winfo_exists():
+        if not self._alive(section_frame):
             return
         
+        self._last_is_fanatic_route = is_fanatic_route
         section_frame.config(bg=Colors.WHITE)
         
         # 更新颜色（仅在狂信徒路线时）
         if is_fanatic_route:
-            self._update_fanatic_section_colors(fanatic_section)
+            self._update_fanatic_section_colors(fanatic_section, configs)
         
         # 调整section位置
         self._adjust_fanatic_section_position(section_frame, scrollable_frame, is_fanatic_route)
     
-    def _update_widget_colors_recursive(self, widget: tk.Widget, color: str) -> None:
-        """递归更新widget中所有Label的文字颜色"""
-        if isinstance(widget, (tk.Label, ttk.Label)):
-            if not isinstance(widget.master, (tk.Button, ttk.Button)):
-                widget.config(foreground=color)
-        elif isinstance(widget, tk.Frame):
-            for child in widget.winfo_children():
-                self._update_widget_colors_recursive(child, color)
+    def _update_label_colors(self, section_key: str, section: tk.Widget, color: str) -> None:
+        """更新section中所有Label的文字颜色
+        
+        首次调用时遍历widget树收集Label并缓存到widget管理器，
+        之后直接遍历缓存列表，不再逐层调用winfo_children。
+        
+        Args:
+            section_key: section的键名
+            section: section的widget
+            color: 文字颜色
+        """
+        labels = self.widget_manager.get_section_labels(section_key)
+        if labels is None:
+            labels = self._collect_labels(section)
+            self.widget_manager.cache_section_labels(section_key, labels)
+        
+        try:
+            for label in labels:
+                label.config(foreground=color)
+        except tk.TclError:
+            # 缓存中有已销毁的Label，重新收集后再应用一次
+            labels = self._collect_labels(section)
+            self.widget_manager.cache_section_labels(section_key, labels)
+            for label in labels:
+                label.config(foreground=color)
+    
+    @staticmethod
+    def _collect_labels(widget: tk.Widget) -> Tuple[tk.Widget, ...]:
+        """迭代收集widget树中所有非按钮内的Label"""
+        labels = []
+        stack = [widget]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, (tk.Label, ttk.Label)):
+                if not isinstance(current.master, (tk.Button, ttk.Button)):
+                    labels.append(current)
+            elif isinstance(current, tk.Frame):
+                stack.extend(current.winfo_children())
+        return tuple(labels)
     
     def _update_dynamic_widgets(self, computed_data: Dict[str, Any]) -> None:
         """更新动态widget"""
@@ -611,31 +998,38 @@ class DataRenderer:
             widget_info = self.widget_manager.get_dynamic_widget("missing_characters")
             if widget_info:
                 section = widget_info.get('section')
-                if section and section.winfo_exists():
+                if self._alive(section):
                     missing_characters = computed_data.get("missing_characters", [])
+                    # 列表内容与当前显示一致时无需销毁重建
+                    items = tuple(missing_characters)
+                    if widget_info.get('items') == items:
+                        return
+                    widget_info['items'] = items
+                    
                     if widget_info.get('is_list'):
                         # 清理旧的列表widget
-                        for child in section.winfo_children():
-                            if hasattr(child, 'items_data'):
-                                child.destroy()
+                        list_widget = self.widget_manager.get_list_widget("missing_characters")
+                        if list_widget is not None and list_widget.winfo_exists():
+                            list_widget.destroy()
                     
                     if missing_characters:
-                        add_list_info(
+                        list_widget = add_list_info(
                             section, 
-                            self.translation_func("missing_characters"), 
+                            self._tr("missing_characters"), 
                             missing_characters,
                             self.cached_width,
-                            self.translation_func
+                            self._tr
                         )
+                        self.widget_manager.register_list_widget("missing_characters", list_widget)
                         widget_info['is_list'] = True
                     else:
                         add_info_line(
                             section, 
-                            self.translation_func("missing_characters"), 
-                            self.translation_func("none"), 
+                            self._tr("missing_characters"), 
+                            self._tr("none"), 
                             self.widget_manager,
                             self.cached_width,
-                            self.translation_func,
+                            self._tr,
                             None, 
                             "missing_characters"
                         )
@@ -650,119 +1044,81 @@ class DataRenderer:
         is_initialized_ref: Dict[str, bool]
     ) -> None:
         """更新所有字段的值"""
-        # 更新非狂信徒section的字段
-        for section_key, section_config in configs.items():
-            if section_key == SECTION_KEY_FANATIC_RELATED:
+        # 增量更新模式（parent为None）下各调用点共用的参数
+        update_line = partial(
+            add_info_line,
+            None,
+            widget_manager=self.widget_manager,
+            cached_width=self.cached_width,
+            translation_func=self._tr,
+            is_initialized_ref=is_initialized_ref
+        )
+        update_tooltip_line = partial(
+            add_info_line_with_tooltip,
+            None,
+            widget_manager=self.widget_manager,
+            cached_width=self.cached_width,
+            translation_func=self._tr,
+            is_initialized_ref=is_initialized_ref
+        )
+        
+        def update_plain(plan: FieldPlan, label: str, value: Any, tooltip_text: str) -> None:
+            update_line(
+                label,
+                value,
+                var_name=plan.var_name,
+                widget_key=plan.widget_key
+            )
+        
+        def update_with_tooltip(plan: FieldPlan, label: str, value: Any, tooltip_text: str) -> None:
+            if not tooltip_text and plan.tooltip_optional:
+                update_plain(plan, label, value, tooltip_text)
+                return
+            update_tooltip_line(
+                label,
+                value,
+                tooltip_text,
+                var_name=plan.var_name,
+                widget_key=plan.widget_key
+            )
+        
+        # 按FIELD_KIND_*下标分派的更新函数，None表示该类字段不在此更新
+        updaters = (
+            update_plain,         # FIELD_KIND_STATIC
+            update_with_tooltip,  # FIELD_KIND_TOOLTIP
+            update_plain,         # FIELD_KIND_LIST
+            update_plain,         # FIELD_KIND_DYNAMIC
+            None                  # FIELD_KIND_DYNAMIC_LIST（由_update_dynamic_widgets处理）
+        )
+        last_values = self._last_values
+        
+        # 狂信徒路线时狂信徒section的字段不在此更新
+        for section_key in configs:
+            if is_fanatic_route and section_key == SECTION_KEY_FANATIC_RELATED:
                 continue
             
-            for field_config in section_config.get("fields", []):
-                widget_key = field_config.get("widget_key")
-                if not widget_key:
+            for plan in self._get_field_plans(section_key, configs):
+                widget_key = plan.widget_key
+                updater = updaters[plan.kind]
+                if not widget_key or updater is None:
                     continue
                 
                 value = format_field_value(
-                    field_config, 
+                    plan.field_config, 
                     save_data, 
                     computed_data, 
-                    self.translation_func
+                    self._tr
                 )
+                label = self._tr(plan.label_key)
+                tooltip_text = ""
+                if plan.kind == FIELD_KIND_TOOLTIP and plan.tooltip_key:
+                    tooltip_text = self._tr(plan.tooltip_key)
                 
-                if field_config.get("is_dynamic") and field_config.get("is_list"):
+                # 显示文本与上次写入一致时不再触发widget更新
+                rendered = (str(value), label, tooltip_text)
+                if last_values.get(widget_key) == rendered:
                     continue
+                last_values[widget_key] = rendered
                 
-                if field_config.get("has_tooltip"):
-                    tooltip_key = field_config.get("tooltip_key")
-                    tooltip_text = self.translation_func(tooltip_key) if tooltip_key else ""
-                    # 替换占位符
-                    if "[GAMEPATCH_DATE]" in tooltip_text:
-                        tooltip_text = tooltip_text.replace("[GAMEPATCH_DATE]", LATEST_GAME_PATCH_AT_BUILD)
-                    if not tooltip_text and field_config.get("tooltip_optional"):
-                        add_info_line(
-                            None,
-                            self.translation_func(field_config["label_key"]),
-                            value,
-                            self.widget_manager,
-                            self.cached_width,
-                            self.translation_func,
-                            field_config.get("var_name"),
-                            widget_key,
-                            None,
-                            is_initialized_ref
-                        )
-                        continue
-                    
-                    add_info_line_with_tooltip(
-                        None,
-                        self.translation_func(field_config["label_key"]),
-                        value,
-                        tooltip_text,
-                        self.widget_manager,
-                        self.cached_width,
-                        self.translation_func,
-                        field_config.get("var_name"),
-                        widget_key,
-                        None,
-                        is_initialized_ref
-                    )
-                else:
-                    add_info_line(
-                        None,
-                        self.translation_func(field_config["label_key"]),
-                        value,
-                        self.widget_manager,
-                        self.cached_width,
-                        self.translation_func,
-                        field_config.get("var_name"),
-                        widget_key,
-                        None,
-                        is_initialized_ref
-                    )
-        
-        # 更新狂信徒section的字段（如果不是狂信徒路线）
-        if not is_fanatic_route:
-            fanatic_config = configs.get(SECTION_KEY_FANATIC_RELATED, {})
-            for field_config in fanatic_config.get("fields", []):
-                widget_key = field_config.get("widget_key")
-                if not widget_key:
-                    continue
-                
-                value = format_field_value(
-                    field_config, 
-                    save_data, 
-                    computed_data, 
-                    self.translation_func
-                )
-                
-                if field_config.get("has_tooltip"):
-                    tooltip_key = field_config.get("tooltip_key", "")
-                    tooltip_text = self.translation_func(tooltip_key) if tooltip_key else ""
-                    # 替换占位符
-                    if "[GAMEPATCH_DATE]" in tooltip_text:
-                        tooltip_text = tooltip_text.replace("[GAMEPATCH_DATE]", LATEST_GAME_PATCH_AT_BUILD)
-                    add_info_line_with_tooltip(
-                        None,
-                        self.translation_func(field_config["label_key"]),
-                        value,
-                        tooltip_text,
-                        self.widget_manager,
-                        self.cached_width,
-                        self.translation_func,
-                        field_config.get("var_name"),
-                        widget_key,
-                        None,
-                        is_initialized_ref
-                    )
-                else:
-                    add_info_line(
-                        None,
-                        self.translation_func(field_config["label_key"]),
-                        value,
-                        self.widget_manager,
-                        self.cached_width,
-                        self.translation_func,
-                        field_config.get("var_name"),
-                        widget_key,
-                        None,
-                        is_initialized_ref
-                    )
+                updater(plan, label, value, tooltip_text)
 
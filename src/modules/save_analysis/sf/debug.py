@@ -4,276 +4,488 @@
 此模块可以安全删除，不会影响主程序运行。
 """
 
+import atexit
+import collections
+import functools
 import logging
-import traceback
-from typing import Optional, Tuple
+import os
+import sys
+from typing import Any, Optional, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
+# 日志前缀
+ERROR_PREFIX = "[错误]"
+WARNING_PREFIX = "[警告]"
+INFO_PREFIX = "[信息]"
 
-class AnalyzerDebugger:
-    """存档分析器调试工具"""
+_LEVEL_PREFIXES = {
+    logging.ERROR: ERROR_PREFIX,
+    logging.WARNING: WARNING_PREFIX,
+    logging.INFO: INFO_PREFIX,
+}
+
+# 日志消息模板（级别前缀由_LevelPrefixFilter统一添加，调用时只需一次%插值）
+_SECTION_ERRORS_SUMMARY_TMPL = "本轮渲染中重复出现的 section 异常（每类仅记录了前 %d 次堆栈）: %s"
+_SECTION_ERRORS_SUPPRESSED_TMPL = "section '%s' 中的 %s 异常已达 %d 次，本轮渲染不再逐条记录"
+_REFRESH_START_MSG = "开始刷新存档分析页面..."
+_REFRESH_COMPLETE_MSG = "存档分析页面刷新完成"
+_NO_CHILDREN_MSG = "左侧数据浏览区域加载后没有任何子组件"
+_CHILDREN_COUNT_TMPL = "左侧数据浏览区域成功加载，包含 %d 个子组件"
+_NO_SECTIONS_MSG = "display_save_info: 没有成功渲染任何 section"
+_SECTIONS_RENDERED_TMPL = "display_save_info: 成功渲染了 %d 个 section"
+_SECTION_RENDER_ERR_TMPL = "_render_section: section '%s' 渲染过程中发生未捕获的异常: %s"
+_SECTION_CREATION_ERR_TMPL = "_render_section: 创建 section '%s' 时发生异常: %s"
+_SECTION_FIELD_ERR_TMPL = "_render_section: section '%s' 渲染字段 '%s' 时发生异常: %s"
+_SECTION_WARNING_TMPL = "_render_section: section '%s': %s"
+_NO_FIELDS_TMPL = "_render_section: section '%s' 没有成功渲染任何字段"
+_TAB_CHANGE_TMPL = "切换到标签页索引: %s"
+_TAB_REFRESH_START_MSG = "切换到存档分析页面，开始刷新..."
+_TAB_REFRESH_ERR_TMPL = "刷新存档分析页面时发生异常: %s"
+_TAB_WARNING_TMPL = "%s"
+_DISPLAY_ERR_TMPL = "显示存档信息时发生异常: %r (scrollable_frame=%s)"
+
+# 左侧数据浏览区域必须存在的组件属性（按检查顺序排列）
+_REQUIRED_SCROLLABLE_ATTRS = ('scrollable_frame', 'scrollable_canvas')
+
+# getattr的缺省哨兵，用于区分属性不存在与属性值为None
+_MISSING = object()
+
+# 本轮渲染中section错误的出现次数：(section_key, 异常类型名) -> 次数
+_section_error_counts: collections.Counter = collections.Counter()
+
+# 每个(section_key, 异常类型名)在一轮渲染中最多记录完整堆栈的次数
+_SECTION_ERROR_SAMPLE_LIMIT = 5
+
+# 设置环境变量 DCSM_DEBUG_PRINT=1 时同时将调试信息输出到标准输出
+_DEBUG_PRINT = os.environ.get("DCSM_DEBUG_PRINT") == "1"
+
+# 设置环境变量 DCSM_DEBUG=1（或DCSM_DEBUG_PRINT=1）时才记录刷新/切换标签页等高频信息
+_DEBUG = _DEBUG_PRINT or os.environ.get("DCSM_DEBUG") == "1"
+
+
+class _DeferredFlushHandler(logging.StreamHandler):
+    """写入记录后不立即flush的StreamHandler
     
-    ERROR_PREFIX = "[错误]"
-    WARNING_PREFIX = "[警告]"
-    INFO_PREFIX = "[信息]"
+    由队列监听线程在队列清空时调用flush_buffer统一刷新，
+    连续的多条日志合并为一次写入。
+    """
     
-    @staticmethod
-    def check_scrollable_components(analyzer) -> Tuple[bool, Optional[str]]:
-        """检查左侧区域的关键组件是否存在
-        
-        Args:
-            analyzer: SaveAnalyzer 实例
-            
-        Returns:
-            (is_valid, error_message) 元组
-        """
-        required_attrs = ('scrollable_frame', 'scrollable_canvas')
-        
-        for attr_name in required_attrs:
-            if not hasattr(analyzer, attr_name):
-                error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} {attr_name} 属性不存在"
-                logger.error(error_msg)
-                return False, error_msg
-            
-            widget = getattr(analyzer, attr_name)
-            if widget is None:
-                error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} {attr_name} 为 None"
-                logger.error(error_msg)
-                return False, error_msg
-            
-            try:
-                if not widget.winfo_exists():
-                    error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} {attr_name} 已销毁，无法刷新左侧数据浏览区域"
-                    logger.error(error_msg)
-                    return False, error_msg
-            except (AttributeError, RuntimeError) as e:
-                error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} 检查 {attr_name} 时发生异常: {e}"
-                logger.exception(error_msg)
-                return False, error_msg
-        
-        return True, None
-    
-    @staticmethod
-    def log_refresh_start() -> None:
-        """记录刷新开始"""
-        message = f"{AnalyzerDebugger.INFO_PREFIX} 开始刷新存档分析页面..."
-        logger.info(message)
-        print(message)
-    
-    @staticmethod
-    def log_refresh_complete() -> None:
-        """记录刷新完成"""
-        message = f"{AnalyzerDebugger.INFO_PREFIX} 存档分析页面刷新完成"
-        logger.info(message)
-        print(message)
-    
-    @staticmethod
-    def log_children_count(analyzer, count: int) -> None:
-        """记录子组件数量
-        
-        Args:
-            analyzer: SaveAnalyzer 实例（未使用，保留用于接口一致性）
-            count: 子组件数量
-        """
-        if count == 0:
-            message = f"{AnalyzerDebugger.WARNING_PREFIX} 左侧数据浏览区域加载后没有任何子组件"
-            logger.warning(message)
-            print(message)
-        else:
-            message = f"{AnalyzerDebugger.INFO_PREFIX} 左侧数据浏览区域成功加载，包含 {count} 个子组件"
-            logger.info(message)
-            print(message)
-    
-    @staticmethod
-    def log_display_error(error: Exception, analyzer) -> None:
-        """记录显示存档信息时的错误
-        
-        Args:
-            error: 异常对象
-            analyzer: SaveAnalyzer 实例
-        """
-        error_type_name = type(error).__name__
-        logger.exception(f"显示存档信息时发生异常: {error_type_name}")
-        
-        print(f"{AnalyzerDebugger.ERROR_PREFIX} 显示存档信息时发生异常: {error}")
-        traceback.print_exc()
-        print(f"{AnalyzerDebugger.ERROR_PREFIX} 异常类型: {error_type_name}")
-        
-        has_scrollable_frame = hasattr(analyzer, 'scrollable_frame')
-        print(f"{AnalyzerDebugger.ERROR_PREFIX} scrollable_frame 存在: {has_scrollable_frame}")
-        
-        if has_scrollable_frame:
-            try:
-                exists = analyzer.scrollable_frame.winfo_exists()
-                print(f"{AnalyzerDebugger.ERROR_PREFIX} scrollable_frame.winfo_exists(): {exists}")
-            except (AttributeError, RuntimeError):
-                print(f"{AnalyzerDebugger.ERROR_PREFIX} 无法检查 scrollable_frame.winfo_exists()")
-    
-    @staticmethod
-    def check_parent_validity(parent, context: str) -> Tuple[bool, Optional[str]]:
-        """检查父容器有效性
-        
-        Args:
-            parent: 父容器对象
-            context: 上下文描述
-            
-        Returns:
-            (is_valid, error_message) 元组
-        """
-        if parent is None:
-            error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} {context}: parent 参数为 None"
-            logger.error(error_msg)
-            return False, error_msg
-        
+    def flush(self) -> None:
+        """逐条记录时不刷新"""
+    
+    def flush_buffer(self) -> None:
+        """将缓冲区中的内容写出"""
+        self.acquire()
         try:
-            if not parent.winfo_exists():
-                error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} {context}: parent 已销毁"
-                logger.error(error_msg)
-                return False, error_msg
-        except (AttributeError, RuntimeError) as e:
-            error_msg = f"{AnalyzerDebugger.ERROR_PREFIX} {context}: 检查 parent 时发生异常: {e}"
-            logger.exception(error_msg)
-            return False, error_msg
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+# 标准输出的写入在后台线程完成，UI线程记录日志时只需入队
+_log_listener: Optional[Any] = None
+_stdout_handler: Optional[_DeferredFlushHandler] = None
+
+
+def _start_stdout_logging() -> None:
+    """启动输出到标准输出的后台日志线程
+    
+    logging.handlers和queue只在启用DCSM_DEBUG_PRINT时才需要，
+    在这里按需导入，正常启动时不加载。
+    """
+    global _log_listener, _stdout_handler
+    import logging.handlers
+    import queue
+    
+    class _BatchingQueueListener(logging.handlers.QueueListener):
+        """队列暂时为空时先刷新各handler缓冲区，再阻塞等待下一条记录"""
         
-        return True, None
+        def dequeue(self, block: bool) -> logging.LogRecord:
+            try:
+                return self.queue.get(block=False)
+            except queue.Empty:
+                for handler in self.handlers:
+                    if isinstance(handler, _DeferredFlushHandler):
+                        handler.flush_buffer()
+                return self.queue.get(block)
+    
+    # 由logging统一输出到标准输出（包括logger.exception记录的堆栈），不再单独print；
+    # 直接写入程序共用的sys.stdout，与其他输出保持顺序，也不会在退出时关闭它
+    _stdout_handler = _DeferredFlushHandler(sys.stdout)
+    _stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    _log_listener = _BatchingQueueListener(
+        log_queue,
+        _stdout_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+if _DEBUG_PRINT:
+    _start_stdout_logging()
+
+
+def shutdown_debugger() -> None:
+    """停止后台日志线程并输出队列中剩余的日志（程序退出时调用，可重复调用）"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    listener, _log_listener = _log_listener, None
+    listener.stop()
+    if _stdout_handler is not None:
+        _stdout_handler.flush_buffer()
+
+
+atexit.register(shutdown_debugger)
+
+
+class _LevelPrefixFilter(logging.Filter):
+    """按日志级别为本模块的消息添加前缀
+    
+    过滤器在级别检查通过后才会执行，被级别过滤掉的日志不会拼接前缀。
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        prefix = _LEVEL_PREFIXES.get(record.levelno)
+        if prefix is not None:
+            record.msg = f"{prefix} {record.msg}"
+        return True
+
+
+logger.addFilter(_LevelPrefixFilter())
+
+
+def _record_section_error(section_key: str, error: Exception) -> bool:
+    """累计一次section错误
     
-    @staticmethod
-    def log_sections_rendered(count: int) -> None:
-        """记录渲染的 section 数量
+    同一section的同类异常在一轮渲染中只记录前_SECTION_ERROR_SAMPLE_LIMIT次完整堆栈，
+    达到上限时输出一条提示，其余只计数，由flush_section_errors统一输出摘要。
+    
+    Args:
+        section_key: section 键名
+        error: 异常对象
         
-        Args:
-            count: section 数量
-        """
-        if count == 0:
-            message = f"{AnalyzerDebugger.WARNING_PREFIX} display_save_info: 没有成功渲染任何 section"
-            logger.warning(message)
-            print(message)
-        else:
-            message = f"{AnalyzerDebugger.INFO_PREFIX} display_save_info: 成功渲染了 {count} 个 section"
-            logger.info(message)
-            print(message)
-    
-    @staticmethod
-    def log_section_render_error(section_key: str, error: Exception) -> None:
-        """记录 section 渲染错误
+    Returns:
+        仍在采样上限内、需要完整记录时返回True
+    """
+    key = (section_key, type(error).__name__)
+    seen = _section_error_counts[key]
+    _section_error_counts[key] = seen + 1
+    if seen < _SECTION_ERROR_SAMPLE_LIMIT:
+        return True
+    if seen == _SECTION_ERROR_SAMPLE_LIMIT:
+        logger.warning(_SECTION_ERRORS_SUPPRESSED_TMPL, section_key, key[1], seen)
+    return False
+
+
+def reset_section_errors() -> None:
+    """清空section错误计数（每轮渲染开始时调用，丢弃上一轮异常中断后残留的计数）"""
+    _section_error_counts.clear()
+
+
+def flush_section_errors() -> None:
+    """输出本轮渲染中重复出现的section错误摘要并清空计数（每轮渲染结束时调用）"""
+    if not _section_error_counts:
+        return
+    repeated = [
+        f"{section_key}/{error_type}: {count}"
+        for (section_key, error_type), count in _section_error_counts.items()
+        if count > _SECTION_ERROR_SAMPLE_LIMIT
+    ]
+    _section_error_counts.clear()
+    if repeated:
+        logger.error(_SECTION_ERRORS_SUMMARY_TMPL, _SECTION_ERROR_SAMPLE_LIMIT, ", ".join(repeated))
+
+
+def _invalid(message: str) -> Tuple[bool, str]:
+    """记录一次检查失败并返回带前缀的错误消息
+    
+    Args:
+        message: 不含前缀的错误描述
         
-        Args:
-            section_key: section 键名
-            error: 异常对象
-        """
-        message = f"{AnalyzerDebugger.ERROR_PREFIX} _render_section: section '{section_key}' 渲染过程中发生未捕获的异常: {error}"
-        logger.exception(message)
-        print(message)
-        traceback.print_exc()
-    
-    @staticmethod
-    def log_section_creation_error(section_key: str, error: Exception) -> None:
-        """记录 section 创建错误
+    Returns:
+        (False, error_message) 元组
+    """
+    logger.error("%s", message)
+    return False, f"{ERROR_PREFIX} {message}"
+
+
+def check_scrollable_components(analyzer) -> Tuple[bool, Optional[str]]:
+    """检查左侧区域的关键组件是否存在
+    
+    Args:
+        analyzer: SaveAnalyzer 实例
         
-        Args:
-            section_key: section 键名
-            error: 异常对象
-        """
-        message = f"{AnalyzerDebugger.ERROR_PREFIX} _render_section: 创建 section '{section_key}' 时发生异常: {error}"
-        logger.exception(message)
-        print(message)
-        traceback.print_exc()
-    
-    @staticmethod
-    def log_section_field_error(section_key: str, widget_key: str, error: Exception) -> None:
-        """记录字段渲染错误
+    Returns:
+        (is_valid, error_message) 元组
+    """
+    # 返回给调用方的错误消息不经过logging，由_invalid补上前缀
+    for attr_name in _REQUIRED_SCROLLABLE_ATTRS:
+        widget = getattr(analyzer, attr_name, _MISSING)
+        if widget is _MISSING:
+            return _invalid(f"{attr_name} 属性不存在")
         
-        Args:
-            section_key: section 键名
-            widget_key: widget 键名
-            error: 异常对象
-        """
-        message = f"{AnalyzerDebugger.ERROR_PREFIX} _render_section: section '{section_key}' 渲染字段 '{widget_key}' 时发生异常: {error}"
-        logger.exception(message)
-        print(message)
-        traceback.print_exc()
-    
-    @staticmethod
-    def log_section_warning(section_key: str, message: str) -> None:
-        """记录 section 警告
+        if widget is None:
+            return _invalid(f"{attr_name} 为 None")
         
-        Args:
-            section_key: section 键名
-            message: 警告消息
-        """
-        full_message = f"{AnalyzerDebugger.WARNING_PREFIX} _render_section: section '{section_key}': {message}"
-        logger.warning(full_message)
-        print(full_message)
-    
-    @staticmethod
-    def log_section_fields_rendered(section_key: str, count: int) -> None:
-        """记录字段渲染数量
+        # 先确认对象是widget，正常路径上不需要异常处理
+        winfo_exists = getattr(widget, 'winfo_exists', None)
+        if winfo_exists is None:
+            return _invalid(f"{attr_name} 不是有效的widget")
         
-        Args:
-            section_key: section 键名
-            count: 字段数量
-        """
-        if count == 0:
-            message = f"{AnalyzerDebugger.WARNING_PREFIX} _render_section: section '{section_key}' 没有成功渲染任何字段"
-            logger.warning(message)
-            print(message)
-    
-    @staticmethod
-    def log_tab_change(tab_index: int) -> None:
-        """记录标签页切换
+        if not winfo_exists():
+            return _invalid(f"{attr_name} 已销毁，无法刷新左侧数据浏览区域")
+    
+    return True, None
+
+
+def log_refresh_start() -> None:
+    """记录刷新开始"""
+    if not _DEBUG:
+        return
+    logger.info(_REFRESH_START_MSG)
+
+
+def log_refresh_complete() -> None:
+    """记录刷新完成"""
+    if not _DEBUG:
+        return
+    logger.info(_REFRESH_COMPLETE_MSG)
+
+
+def log_children_count(analyzer, count: int) -> None:
+    """记录子组件数量
+    
+    Args:
+        analyzer: SaveAnalyzer 实例（未使用，保留用于接口一致性）
+        count: 子组件数量
+    """
+    if count:
+        logger.info(_CHILDREN_COUNT_TMPL, count)
+        return
+    logger.warning(_NO_CHILDREN_MSG)
+
+
+def _sf_state(analyzer) -> str:
+    """描述分析器 scrollable_frame 的状态
+    
+    Args:
+        analyzer: SaveAnalyzer 实例
         
-        Args:
-            tab_index: 标签页索引
-        """
-        message = f"{AnalyzerDebugger.INFO_PREFIX} 切换到标签页索引: {tab_index}"
-        logger.info(message)
-        print(message)
-    
-    @staticmethod
-    def log_tab_refresh_start() -> None:
-        """记录标签页刷新开始"""
-        message = f"{AnalyzerDebugger.INFO_PREFIX} 切换到存档分析页面，开始刷新..."
-        logger.info(message)
-        print(message)
-    
-    @staticmethod
-    def log_tab_refresh_error(error: Exception) -> None:
-        """记录标签页刷新错误
+    Returns:
+        "missing"、"None"、"invalid"、"destroyed" 或 "ok"
+    """
+    frame = getattr(analyzer, 'scrollable_frame', _MISSING)
+    if frame is _MISSING:
+        return "missing"
+    if frame is None:
+        return "None"
+    winfo_exists = getattr(frame, 'winfo_exists', None)
+    if winfo_exists is None:
+        return "invalid"
+    return "ok" if winfo_exists() else "destroyed"
+
+
+def format_display_error(error: Exception, analyzer) -> str:
+    """格式化显示存档信息时的错误描述（不含堆栈）
+    
+    Args:
+        error: 异常对象
+        analyzer: SaveAnalyzer 实例
         
-        Args:
-            error: 异常对象
-        """
-        message = f"{AnalyzerDebugger.ERROR_PREFIX} 刷新存档分析页面时发生异常: {error}"
-        logger.exception(message)
-        print(message)
-        traceback.print_exc()
-    
-    @staticmethod
-    def log_tab_warning(message: str) -> None:
-        """记录标签页警告
+    Returns:
+        错误描述文本
+    """
+    return f"{ERROR_PREFIX} {_DISPLAY_ERR_TMPL % (error, _sf_state(analyzer))}"
+
+
+def log_display_error(error: Exception, analyzer) -> None:
+    """记录显示存档信息时的错误
+    
+    异常类型、消息和堆栈由一次logger.exception输出。
+    
+    Args:
+        error: 异常对象
+        analyzer: SaveAnalyzer 实例
+    """
+    logger.exception(_DISPLAY_ERR_TMPL, error, _sf_state(analyzer))
+
+
+def check_parent_validity(parent, context: str) -> Tuple[bool, Optional[str]]:
+    """检查父容器有效性
+    
+    Args:
+        parent: 父容器对象
+        context: 上下文描述
         
-        Args:
-            message: 警告消息
-        """
-        full_message = f"{AnalyzerDebugger.WARNING_PREFIX} {message}"
-        logger.warning(full_message)
-        print(full_message)
+    Returns:
+        (is_valid, error_message) 元组
+    """
+    if parent is None:
+        return _invalid(f"{context}: parent 参数为 None")
+    
+    winfo_exists = getattr(parent, 'winfo_exists', None)
+    if winfo_exists is None:
+        return _invalid(f"{context}: parent 不是有效的widget")
+    
+    if not winfo_exists():
+        return _invalid(f"{context}: parent 已销毁")
+    
+    return True, None
+
+
+def log_sections_rendered(count: int) -> None:
+    """记录渲染的 section 数量
+    
+    Args:
+        count: section 数量
+    """
+    if count:
+        logger.info(_SECTIONS_RENDERED_TMPL, count)
+        return
+    logger.warning(_NO_SECTIONS_MSG)
 
 
-_debugger_instance: Optional[AnalyzerDebugger] = None
+def log_section_render_error(section_key: str, error: Exception) -> None:
+    """记录 section 渲染错误
+    
+    Args:
+        section_key: section 键名
+        error: 异常对象
+    """
+    if not _record_section_error(section_key, error):
+        return
+    logger.exception(_SECTION_RENDER_ERR_TMPL, section_key, error)
 
 
-def get_debugger() -> Optional[AnalyzerDebugger]:
-    """获取调试器实例（如果可用）
+def log_section_creation_error(section_key: str, error: Exception) -> None:
+    """记录 section 创建错误
+    
+    Args:
+        section_key: section 键名
+        error: 异常对象
+    """
+    if not _record_section_error(section_key, error):
+        return
+    logger.exception(_SECTION_CREATION_ERR_TMPL, section_key, error)
+
+
+def log_section_field_error(section_key: str, widget_key: str, error: Exception) -> None:
+    """记录字段渲染错误
+    
+    Args:
+        section_key: section 键名
+        widget_key: widget 键名
+        error: 异常对象
+    """
+    if not _record_section_error(section_key, error):
+        return
+    logger.exception(_SECTION_FIELD_ERR_TMPL, section_key, widget_key, error)
+
+
+def log_section_warning(section_key: str, message: str) -> None:
+    """记录 section 警告
+    
+    Args:
+        section_key: section 键名
+        message: 警告消息
+    """
+    logger.warning(_SECTION_WARNING_TMPL, section_key, message)
+
+
+def log_section_fields_rendered(section_key: str, count: int) -> None:
+    """记录字段渲染数量
+    
+    Args:
+        section_key: section 键名
+        count: 字段数量
+    """
+    if count:
+        return
+    logger.warning(_NO_FIELDS_TMPL, section_key)
+
+
+def log_tab_change(tab_index: int) -> None:
+    """记录标签页切换
+    
+    Args:
+        tab_index: 标签页索引
+    """
+    if not _DEBUG:
+        return
+    logger.info(_TAB_CHANGE_TMPL, tab_index)
+
+
+def log_tab_refresh_start() -> None:
+    """记录标签页刷新开始"""
+    if not _DEBUG:
+        return
+    logger.info(_TAB_REFRESH_START_MSG)
+
+
+def log_tab_refresh_error(error: Exception) -> None:
+    """记录标签页刷新错误
+    
+    Args:
+        error: 异常对象
+    """
+    logger.exception(_TAB_REFRESH_ERR_TMPL, error)
+
+
+def log_tab_warning(message: str) -> None:
+    """记录标签页警告
+    
+    Args:
+        message: 警告消息
+    """
+    logger.warning(_TAB_WARNING_TMPL, message)
+
+
+class AnalyzerDebugger:
+    """存档分析器调试工具
+    
+    各调试函数均为模块级函数，此类仅作为命名空间保留以兼容现有调用方式。
+    """
+    
+    __slots__ = ()
+    
+    ERROR_PREFIX = ERROR_PREFIX
+    WARNING_PREFIX = WARNING_PREFIX
+    INFO_PREFIX = INFO_PREFIX
+    
+    check_scrollable_components = staticmethod(check_scrollable_components)
+    log_refresh_start = staticmethod(log_refresh_start)
+    log_refresh_complete = staticmethod(log_refresh_complete)
+    log_children_count = staticmethod(log_children_count)
+    log_display_error = staticmethod(log_display_error)
+    format_display_error = staticmethod(format_display_error)
+    check_parent_validity = staticmethod(check_parent_validity)
+    log_sections_rendered = staticmethod(log_sections_rendered)
+    log_section_render_error = staticmethod(log_section_render_error)
+    log_section_creation_error = staticmethod(log_section_creation_error)
+    log_section_field_error = staticmethod(log_section_field_error)
+    log_section_warning = staticmethod(log_section_warning)
+    log_section_fields_rendered = staticmethod(log_section_fields_rendered)
+    log_tab_change = staticmethod(log_tab_change)
+    log_tab_refresh_start = staticmethod(log_tab_refresh_start)
+    log_tab_refresh_error = staticmethod(log_tab_refresh_error)
+    log_tab_warning = staticmethod(log_tab_warning)
+    reset_section_errors = staticmethod(reset_section_errors)
+    flush_section_errors = staticmethod(flush_section_errors)
+
+
+@functools.cache
+def get_debugger() -> Type[AnalyzerDebugger]:
+    """获取调试器
+    
+    AnalyzerDebugger 的方法都是静态方法、不持有状态，直接返回类本身即可。
     
     Returns:
-        AnalyzerDebugger 实例，如果模块不可用则返回 None
+        AnalyzerDebugger 类
     """
-    global _debugger_instance
-    if _debugger_instance is None:
-        try:
-            _debugger_instance = AnalyzerDebugger()
-        except Exception:
-            return None
-    return _debugger_instance
+    return AnalyzerDebugger
@@ -6,7 +6,11 @@
 而不是从本包导入。此包包含辅助工具模块和重构后的子模块。
 """
 
-from .json_highlighter import apply_json_syntax_highlight
+from .json_highlighter import (
+    ViewportHighlighter,
+    apply_json_syntax_highlight,
+    configure_json_highlight_tags,
+)
 from .config import (
     DEFAULT_SF_COLLAPSED_FIELDS,
     SAVE_FILE_NAME,
@@ -21,6 +25,8 @@ from .models import ViewerConfig
 
 __all__ = [
     "apply_json_syntax_highlight",
+    "configure_json_highlight_tags",
+    "ViewportHighlighter",
     "DEFAULT_SF_COLLAPSED_FIELDS",
     "SAVE_FILE_NAME",
     "CLOSE_CALLBACK_DELAY_MS",
@@ -0,0 +1,132 @@
+"""后台事件循环模块
+
+提供一个常驻的 asyncio 事件循环线程。运行时读取、注入等协程都提交到这个循环执行，
+不再为每次操作单独创建线程和事件循环；同步的阻塞操作（如写入存档）交给共享线程池。
+"""
+
+import asyncio
+import logging
+import threading
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+# 同步阻塞操作使用的共享线程池（线程按需创建，数量有上限）
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sf-worker")
+
+
+class _LoopThread:
+    """在守护线程中常驻运行的事件循环，首次使用时才启动"""
+    
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+    
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """获取事件循环，尚未启动（或已停止）时启动新的循环线程
+        
+        Returns:
+            正在运行的事件循环
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(loop,),
+                    name="sf-async-loop",
+                    daemon=True
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+    
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        """循环线程入口，停止后取消未完成的任务并关闭循环"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            if pending:
+                for task in pending:
+                    task.cancel()
+                try:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                except Exception as gather_error:
+                    logger.debug("Error gathering pending tasks: %s", gather_error)
+            loop.close()
+    
+    def stop(self) -> None:
+        """停止事件循环（可重复调用）"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+
+
+_loop_thread = _LoopThread()
+
+
+def submit_coroutine(coro: Coroutine[Any, Any, Any]) -> Future:
+    """将协程提交到后台事件循环执行
+    
+    Args:
+        coro: 异步协程对象
+    
+    Returns:
+        协程对应的 concurrent.futures.Future
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _loop_thread.get_loop())
+
+
+def submit_blocking(func: Callable[[], Any]) -> Future:
+    """将同步阻塞操作提交到共享线程池执行
+    
+    Args:
+        func: 无参数的可调用对象
+    
+    Returns:
+        对应的 concurrent.futures.Future
+    """
+    return _EXECUTOR.submit(func)
+
+
+def run_coroutine_for_window(
+    window: tk.Misc,
+    coro: Coroutine[Any, Any, Any],
+    on_done: Callable[[Any, Optional[BaseException]], None]
+) -> Future:
+    """在后台事件循环中执行协程，完成后在Tk主线程中回调
+    
+    Args:
+        window: 用于调度回调的窗口对象
+        coro: 异步协程对象
+        on_done: 完成回调 (result, exception)，协程抛出异常时 result 为 None
+    
+    Returns:
+        协程对应的 concurrent.futures.Future，可用于取消
+    """
+    future = submit_coroutine(coro)
+    
+    def on_future_done(done_future: Future) -> None:
+        if done_future.cancelled():
+            return
+        exception = done_future.exception()
+        result = None if exception is not None else done_future.result()
+        try:
+            window.after(0, lambda: on_done(result, exception))
+        except (RuntimeError, tk.TclError) as e:
+            # 窗口已销毁或主循环已退出，结果直接丢弃
+            logger.debug("Dropping coroutine result, window is gone: %s", e)
+    
+    future.add_done_callback(on_future_done)
+    return future
+
+
+def shutdown_shared_loop() -> None:
+    """停止后台事件循环（程序退出时调用，可重复调用）"""
+    _loop_thread.stop()
@@ -11,9 +11,15 @@ DEFAULT_SF_COLLAPSED_FIELDS: Final[list[str]] = ["record", "_tap_effect", "initi
 # 存档文件名
 SAVE_FILE_NAME: Final[str] = "DevilConnection_sf.sav"
 
+# 写入存档时每次URL编码的JSON片段长度（字符）及文件写缓冲区大小（字节）
+SAVE_ENCODE_CHUNK_SIZE: Final[int] = 64 * 1024
+SAVE_WRITE_BUFFER_SIZE: Final[int] = 1 << 20
+
 # 时间延迟常量（毫秒）
 CLOSE_CALLBACK_DELAY_MS: Final[int] = 100
 REFRESH_AFTER_INJECT_DELAY_MS: Final[int] = 200
+# 文本变更后延迟处理（行号、变更高亮），连续输入时只处理最后一次
+TEXT_CHANGE_DEBOUNCE_MS: Final[int] = 80
 
 # 单行显示的列表字段（这些字段在JSON格式化时保持在一行内）
 SINGLE_LINE_LIST_FIELDS: Final[FrozenSet[str]] = frozenset([
@@ -35,8 +41,16 @@ LINE_NUMBER_PADY: Final[int] = 2
 TEXT_FONT_SIZE: Final[int] = 10
 TEXT_TABS: Final[tuple[str, ...]] = ("2c", "4c", "6c", "8c", "10c", "12c", "14c", "16c")
 
+# 语法高亮配置：达到该行数后只高亮可见区域附近的行，按行块逐步补全
+LAZY_HIGHLIGHT_MIN_LINES: Final[int] = 2000
+HIGHLIGHT_BLOCK_LINES: Final[int] = 200
+HIGHLIGHT_MARGIN_LINES: Final[int] = 50
+
 # 搜索高亮颜色
 SEARCH_HIGHLIGHT_COLOR: Final[str] = "yellow"
 
 # 用户编辑高亮颜色
 USER_EDIT_HIGHLIGHT_COLOR: Final[str] = "#fff9c4"
+
+# 变更检测时做逐块差异比较的最大行数（去掉首尾相同行后），超过则按行号逐行对比
+CHANGE_DIFF_MAX_LINES: Final[int] = 1000
@@ -4,6 +4,8 @@
 """
 
 import logging
+from bisect import bisect_right
+from difflib import SequenceMatcher
 from typing import Callable, List, Optional, Tuple
 
 import tkinter as tk
@@ -11,10 +13,126 @@ from tkinter import ttk
 
 from src.utils.ui_utils import showwarning_relative
 
-from .config import USER_EDIT_HIGHLIGHT_COLOR
+from .config import CHANGE_DIFF_MAX_LINES, TEXT_CHANGE_DEBOUNCE_MS, USER_EDIT_HIGHLIGHT_COLOR
 
 logger = logging.getLogger(__name__)
 
+# 文本位置 (行, 列)，可直接用元组比较代替 Text.compare
+TextPosition = Tuple[int, int]
+TextRange = Tuple[TextPosition, TextPosition]
+
+# 比任何实际位置都大的哨兵，用于在范围列表中二分查找
+_MAX_POSITION: TextPosition = (2 ** 31, 0)
+
+
+def parse_text_index(index: str) -> TextPosition:
+    """将 Tk 的 "行.列" 索引解析为整数元组
+    
+    Args:
+        index: Text.index 返回的索引
+        
+    Returns:
+        (行, 列) 元组
+    """
+    line, column = index.split('.')
+    return int(line), int(column)
+
+
+def position_in_ranges(ranges: List[TextRange], position: TextPosition) -> bool:
+    """判断位置是否落在某个范围内（起点包含，终点不包含）
+    
+    Args:
+        ranges: 按起点排序且互不重叠的范围列表
+        position: (行, 列) 位置
+        
+    Returns:
+        是否在任一范围内
+    """
+    index = bisect_right(ranges, (position, _MAX_POSITION)) - 1
+    return index >= 0 and position < ranges[index][1]
+
+
+def find_text_ranges(content: str, text: str) -> List[TextRange]:
+    """在文本中查找所有不重叠的出现位置（text 不能包含换行）
+    
+    在 Python 中一次扫描完成，避免逐个调用 Text.search。
+    
+    Args:
+        content: 文本组件的全部内容
+        text: 要查找的文本
+        
+    Returns:
+        按位置排序的 ((起始行, 起始列), (结束行, 结束列)) 列表
+    """
+    ranges: List[TextRange] = []
+    if not text:
+        return ranges
+    
+    text_length = len(text)
+    line_num = 1
+    scanned = 0
+    offset = content.find(text)
+    while offset != -1:
+        line_num += content.count('\n', scanned, offset)
+        scanned = offset
+        column = offset - (content.rfind('\n', 0, offset) + 1)
+        ranges.append(((line_num, column), (line_num, column + text_length)))
+        offset = content.find(text, offset + text_length)
+    return ranges
+
+
+def find_changed_line_ranges(original_lines: List[str], current_lines: List[str]) -> List[str]:
+    """对比原始内容和当前内容，找出被修改或新增的行
+    
+    先去掉首尾相同的行，只对中间部分做差异比较；每个变更块对应一个范围，
+    结果可以直接传给一次 tag_add。被删除的行在当前内容中不存在，不产生范围。
+    差异比较的耗时随行数平方增长，中间部分超过 CHANGE_DIFF_MAX_LINES 行时
+    改为按行号逐行对比。
+    
+    Args:
+        original_lines: 原始内容按行拆分的列表
+        current_lines: 当前内容按行拆分的列表
+        
+    Returns:
+        起点、终点交替排列的 Tk 索引列表
+    """
+    limit = min(len(original_lines), len(current_lines))
+    prefix = 0
+    while prefix < limit and original_lines[prefix] == current_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < limit - prefix
+           and original_lines[-1 - suffix] == current_lines[-1 - suffix]):
+        suffix += 1
+    
+    original_middle = original_lines[prefix:len(original_lines) - suffix]
+    current_middle = current_lines[prefix:len(current_lines) - suffix]
+    
+    ranges: List[str] = []
+    if max(len(original_middle), len(current_middle)) <= CHANGE_DIFF_MAX_LINES:
+        matcher = SequenceMatcher(None, original_middle, current_middle, autojunk=False)
+        for tag, _, _, start, end in matcher.get_opcodes():
+            if tag in ('replace', 'insert'):
+                ranges.append(f"{prefix + start + 1}.0")
+                ranges.append(f"{prefix + end}.end")
+        return ranges
+    
+    # 连续的变更行合并为一个范围
+    original_count = len(original_middle)
+    run_start = 0
+    for line_num, current_line in enumerate(current_middle, start=prefix + 1):
+        if line_num - prefix > original_count or original_middle[line_num - prefix - 1] != current_line:
+            if not run_start:
+                run_start = line_num
+        elif run_start:
+            ranges.append(f"{run_start}.0")
+            ranges.append(f"{line_num - 1}.end")
+            run_start = 0
+    if run_start:
+        ranges.append(f"{run_start}.0")
+        ranges.append(f"{prefix + len(current_middle)}.end")
+    return ranges
+
 
 class EditorController:
     """编辑器控制器，管理编辑状态和变更检测"""
@@ -45,7 +163,10 @@ class EditorController:
         self.window = window
         self.update_line_numbers = update_line_numbers
         self.original_content: str = ""
-        self.collapsed_text_ranges: List[Tuple[str, str]] = []
+        self._original_lines: List[str] = [""]
+        self.collapsed_text_ranges: List[TextRange] = []
+        # 尚未执行的延迟回调ID，连续触发时只保留最后一次
+        self._pending_text_change: Optional[str] = None
         
         self._setup_text_widget()
     
@@ -55,9 +176,9 @@ class EditorController:
         self.text_widget.config(undo=True)
         
         # 绑定事件
+        # 行号更新和变更高亮都由<<Modified>>驱动
         self.text_widget.bind("<<Modified>>", self._on_text_change)
-        self.text_widget.bind("<KeyRelease>", lambda e: self.update_line_numbers())
-        self.text_widget.bind("<Button-1>", lambda e: self.update_line_numbers())
+        self.text_widget.edit_modified(False)
     
     def set_original_content(self, content: str) -> None:
         """设置原始内容（用于变更检测）
@@ -66,6 +187,7 @@ class EditorController:
             content: 原始内容
         """
         self.original_content = content
+        self._original_lines = content.split('\n')
     
     def get_current_content(self) -> str:
         """获取当前文本内容
@@ -87,25 +209,20 @@ class EditorController:
             return False
         return self.get_current_content() != self.original_content
     
-    def update_collapsed_ranges(self, collapsed_text: str) -> None:
+    def update_collapsed_ranges(self, collapsed_text: str, content: Optional[str] = None) -> None:
         """更新折叠文本范围
         
         Args:
             collapsed_text: 折叠文本占位符
+            content: 已读取的当前内容（可选，省去再次从widget读取）
         """
         self.collapsed_text_ranges.clear()
         if not self.enable_edit_var.get() or not self.text_widget.winfo_exists():
             return
         
-        content = self.get_current_content()
-        start_pos = "1.0"
-        while True:
-            pos = self.text_widget.search(collapsed_text, start_pos, "end", exact=True)
-            if not pos:
-                break
-            end_pos = f"{pos}+{len(collapsed_text)}c"
-            self.collapsed_text_ranges.append((pos, end_pos))
-            start_pos = end_pos
+        if content is None:
+            content = self.get_current_content()
+        self.collapsed_text_ranges.extend(find_text_ranges(content, collapsed_text))
     
     def is_in_collapsed_range(self, pos: str) -> bool:
         """检查位置是否在折叠范围内
@@ -119,11 +236,7 @@ class EditorController:
         if not self.enable_edit_var.get() or not self.text_widget.winfo_exists():
             return False
         
-        return any(
-            self.text_widget.compare(start, "<=", pos) and 
-            self.text_widget.compare(pos, "<", end)
-            for start, end in self.collapsed_text_ranges
-        )
+        return position_in_ranges(self.collapsed_text_ranges, parse_text_index(pos))
     
     def handle_edit_attempt(self, event: Optional[tk.Event] = None) -> str:
         """处理编辑尝试（检查是否允许编辑）
@@ -145,8 +258,8 @@ class EditorController:
         if not self.text_widget.winfo_exists():
             return None
         
-        cursor_pos = self.text_widget.index("insert")
-        if self.is_in_collapsed_range(cursor_pos):
+        # 没有折叠文本时不必查询光标位置
+        if self.collapsed_text_ranges and self.is_in_collapsed_range(self.text_widget.index("insert")):
             showwarning_relative(
                 self.window,
                 self.t("cannot_edit_collapsed"),
@@ -156,32 +269,39 @@ class EditorController:
         
         return None
     
-    def detect_and_highlight_changes(self) -> None:
-        """检测并高亮显示变更"""
+    def detect_and_highlight_changes(self, current_content: Optional[str] = None) -> None:
+        """检测并高亮显示变更
+        
+        Args:
+            current_content: 已读取的当前内容（可选，省去再次从widget读取）
+        """
         if not self.enable_edit_var.get() or not self.text_widget.winfo_exists():
             return
         
         self.text_widget.tag_remove("user_edit", "1.0", "end")
-        current_content = self.get_current_content()
+        if current_content is None:
+            current_content = self.get_current_content()
         
         if current_content != self.original_content:
-            original_lines = self.original_content.split('\n')
-            current_lines = current_content.split('\n')
-            max_lines = max(len(original_lines), len(current_lines))
-            
-            for i in range(max_lines):
-                original_line = original_lines[i] if i < len(original_lines) else ""
-                current_line = current_lines[i] if i < len(current_lines) else ""
-                
-                if original_line != current_line:
-                    line_start = f"{i+1}.0"
-                    line_end = f"{i+1}.end"
-                    if (self.text_widget.compare(line_start, "<=", "end") and
-                        self.text_widget.compare(line_end, "<=", "end")):
-                        self.text_widget.tag_add("user_edit", line_start, line_end)
+            ranges = find_changed_line_ranges(self._original_lines, current_content.split('\n'))
+            if ranges:
+                self.text_widget.tag_add("user_edit", *ranges)
     
     def _on_text_change(self, *args) -> None:
-        """文本变更事件处理"""
+        """文本变更事件处理（连续输入时只在停顿后处理最后一次）"""
+        # 清除modified标志才能收到下一次修改；清除标志本身触发的事件直接忽略
+        if not self.text_widget.edit_modified():
+            return
+        self.text_widget.edit_modified(False)
+        if self._pending_text_change is not None:
+            self.window.after_cancel(self._pending_text_change)
+        self._pending_text_change = self.window.after(TEXT_CHANGE_DEBOUNCE_MS, self._process_text_change)
+    
+    def _process_text_change(self) -> None:
+        """执行被合并的文本变更处理"""
+        self._pending_text_change = None
+        if not self.text_widget.winfo_exists():
+            return
         self.update_line_numbers()
         if self.enable_edit_var.get():
             self.detect_and_highlight_changes()
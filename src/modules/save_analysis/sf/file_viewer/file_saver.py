@@ -5,18 +5,60 @@
 
 import json
 import logging
+import os
 import urllib.parse
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from src.utils.ui_utils import showerror_relative, showinfo_relative
 
-from .config import SAVE_FILE_NAME
+from ..save_data_service import load_save_file as load_sf_save_file
+from .config import SAVE_ENCODE_CHUNK_SIZE, SAVE_FILE_NAME, SAVE_WRITE_BUFFER_SIZE
 from .models import ViewerConfig
 
 logger = logging.getLogger(__name__)
 
 
+def write_encoded_save(save_file_path: Union[str, Path], data: Dict[str, Any]) -> None:
+    """将数据序列化为JSON并URL编码后写入存档文件
+    
+    JSON按片段生成、分块编码后直接写入文件，不会同时持有完整的JSON字符串和编码结果。
+    quote 对每个字符单独编码，按字符分块的结果与整体编码相同。
+    先写入同目录下的临时文件，完成后再替换原存档，写入中途出错不会损坏原存档。
+    
+    Args:
+        save_file_path: 存档文件路径
+        data: 要保存的数据
+        
+    Raises:
+        OSError: 文件写入失败
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False)
+    pending: List[str] = []
+    pending_size = 0
+    save_file_path = Path(save_file_path)
+    temp_path = save_file_path.with_name(save_file_path.name + ".tmp")
+    
+    try:
+        with open(temp_path, 'w', encoding='utf-8', buffering=SAVE_WRITE_BUFFER_SIZE) as file_handle:
+            for fragment in encoder.iterencode(data):
+                pending.append(fragment)
+                pending_size += len(fragment)
+                if pending_size >= SAVE_ENCODE_CHUNK_SIZE:
+                    file_handle.write(urllib.parse.quote("".join(pending)))
+                    pending.clear()
+                    pending_size = 0
+            if pending:
+                file_handle.write(urllib.parse.quote("".join(pending)))
+        os.replace(temp_path, save_file_path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
 class FileSaver:
     """文件保存服务，处理文件 I/O 操作"""
     
@@ -58,9 +100,8 @@ class FileSaver:
                 )
                 return None
         
-        from ..save_data_service import load_save_file
         try:
-            return load_save_file(self.storage_dir)
+            return load_sf_save_file(self.storage_dir)
         except Exception as e:
             logger.error(f"Failed to load save file: {e}", exc_info=True)
             showerror_relative(
@@ -122,11 +163,7 @@ class FileSaver:
         save_file_path = Path(self.storage_dir) / SAVE_FILE_NAME
         
         try:
-            json_str = json.dumps(edited_data, ensure_ascii=False)
-            encoded_content = urllib.parse.quote(json_str)
-            
-            with open(save_file_path, 'w', encoding='utf-8') as file_handle:
-                file_handle.write(encoded_content)
+            write_encoded_save(save_file_path, edited_data)
             
             if self.viewer_config.on_save_callback:
                 try:
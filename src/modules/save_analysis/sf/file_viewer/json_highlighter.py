@@ -5,47 +5,190 @@
 
 import re
 import tkinter as tk
+import weakref
+from typing import Dict, List, Optional, Set
 
 from src.utils.styles import Colors, get_mono_font
 
+from .config import HIGHLIGHT_BLOCK_LINES, HIGHLIGHT_MARGIN_LINES, LAZY_HIGHLIGHT_MIN_LINES
 
-def apply_json_syntax_highlight(text_widget: tk.Text, content: str) -> None:
-    """应用JSON语法高亮
+# 高亮标签名（同时也是下方正则中的分组名）
+HIGHLIGHT_TAGS = ('string', 'keyword', 'number', 'bracket', 'punctuation')
+
+# 所有高亮模式合并为一个正则，按分组名决定标签；字符串在最前，其内部内容不会再被其他模式匹配。
+# 字符串支持转义字符（包括 \"），数字支持负号、小数和指数。
+# 换行也作为一个分组匹配，扫描时顺带推进行号，不需要另外计算行起始偏移
+_HIGHLIGHT_PATTERN = re.compile(
+    r'(?P<string>"[^"\\\n]*(?:\\.[^"\\\n]*)*")'
+    r'|(?P<keyword>\b(?:true|false|null)\b)'
+    r'|(?P<number>-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b)'
+    r'|(?P<bracket>[{}[\]])'
+    r'|(?P<punctuation>[:,])'
+    r'|(?P<newline>\n)'
+)
+
+# 已配置过标签样式的文本widget（widget销毁后自动移除）
+_configured_widgets: "weakref.WeakSet[tk.Text]" = weakref.WeakSet()
+
+
+def configure_json_highlight_tags(text_widget: tk.Text) -> None:
+    """配置JSON语法高亮的标签样式
+    
+    每个文本widget只会真正配置一次，重复调用直接返回。
     
     Args:
         text_widget: 文本widget
-        content: 要高亮的JSON内容
     """
-    # 清除所有标签
-    for tag in ['string', 'keyword', 'number', 'bracket', 'punctuation']:
-        text_widget.tag_remove(tag, "1.0", "end")
+    if text_widget in _configured_widgets:
+        return
+    _configured_widgets.add(text_widget)
     
     mono_font = get_mono_font(10)
     
-    # 配置标签样式
     text_widget.tag_config('string', foreground='#008000', font=mono_font)
     text_widget.tag_config('keyword', foreground='#0000FF', font=mono_font)
     text_widget.tag_config('number', foreground='#FF0000', font=mono_font)
     text_widget.tag_config('bracket', foreground='#000000', font=(mono_font[0], mono_font[1], "bold"))
     text_widget.tag_config('punctuation', foreground=Colors.TEXT_MUTED, font=mono_font)
+
+
+def _collect_highlight_ranges(
+    content: str,
+    first_line: int,
+    ranges_by_tag: Dict[str, List[str]]
+) -> None:
+    """扫描文本，按标签收集 起点、终点 交替排列的索引
     
-    # 单次遍历所有模式
-    patterns = [
-        (r'"[^"]*"', 'string'),
-        (r'\b(true|false|null)\b', 'keyword'),
-        (r'\b\d+\.?\d*\b', 'number'),
-        (r'[{}[\]]', 'bracket'),
-        (r'[:,]', 'punctuation'),
-    ]
+    Args:
+        content: 要扫描的文本（由完整的行组成）
+        first_line: content 第一行在文本widget中的行号
+        ranges_by_tag: 标签名到索引列表的映射，结果追加到其中
+    """
+    line_num = first_line
+    line_start = 0
+    for match in _HIGHLIGHT_PATTERN.finditer(content):
+        tag = match.lastgroup
+        if tag == 'newline':
+            line_num += 1
+            line_start = match.end()
+            continue
+        ranges = ranges_by_tag[tag]
+        ranges.append(f"{line_num}.{match.start() - line_start}")
+        ranges.append(f"{line_num}.{match.end() - line_start}")
+
+
+def _add_highlight_ranges(text_widget: tk.Text, ranges_by_tag: Dict[str, List[str]]) -> None:
+    """将收集到的范围添加到文本widget
     
-    lines = content.split('\n')
-    for line_num, line in enumerate(lines, start=1):
-        for pattern, tag_name in patterns:
-            for match in re.finditer(pattern, line):
-                start_pos = f"{line_num}.{match.start()}"
-                end_pos = f"{line_num}.{match.end()}"
-                text_widget.tag_add(tag_name, start_pos, end_pos)
+    Tk的tag add接受多组索引，每个标签只需一次Tcl调用。
+    
+    Args:
+        text_widget: 文本widget
+        ranges_by_tag: 标签名到索引列表的映射
+    """
+    for tag, ranges in ranges_by_tag.items():
+        if ranges:
+            text_widget.tag_add(tag, *ranges)
 
 
+def _clear_highlight_tags(text_widget: tk.Text) -> None:
+    """清除所有语法高亮标签"""
+    for tag in HIGHLIGHT_TAGS:
+        text_widget.tag_remove(tag, "1.0", "end")
+
 
+def apply_json_syntax_highlight(text_widget: tk.Text, content: str) -> None:
+    """应用JSON语法高亮
+    
+    Args:
+        text_widget: 文本widget
+        content: 要高亮的JSON内容
+    """
+    configure_json_highlight_tags(text_widget)
+    _clear_highlight_tags(text_widget)
+    
+    # 对整个内容只扫描一次
+    ranges_by_tag: Dict[str, List[str]] = {tag: [] for tag in HIGHLIGHT_TAGS}
+    _collect_highlight_ranges(content, 1, ranges_by_tag)
+    _add_highlight_ranges(text_widget, ranges_by_tag)
 
+
+class ViewportHighlighter:
+    """按可见区域延迟应用JSON语法高亮
+    
+    行数较少时与 apply_json_syntax_highlight 相同，一次高亮全部内容；
+    大文档只高亮可见区域附近的行块，滚动或窗口尺寸变化后在空闲时补上新进入视野的行块。
+    """
+    
+    def __init__(self, text_widget: tk.Text):
+        """初始化高亮器并配置标签样式
+        
+        Args:
+            text_widget: 文本widget
+        """
+        self.text_widget = text_widget
+        self._line_count = 0
+        self._lazy = False
+        self._highlighted_blocks: Set[int] = set()
+        self._pending_id: Optional[str] = None
+        configure_json_highlight_tags(text_widget)
+    
+    def set_content(self, content: str) -> None:
+        """文本widget的内容被替换后调用，重新开始高亮
+        
+        Args:
+            content: 文本widget中的新内容
+        """
+        self._cancel_pending()
+        self._highlighted_blocks.clear()
+        self._line_count = content.count('\n') + 1
+        self._lazy = self._line_count >= LAZY_HIGHLIGHT_MIN_LINES
+        
+        if not self._lazy:
+            apply_json_syntax_highlight(self.text_widget, content)
+            return
+        
+        _clear_highlight_tags(self.text_widget)
+        self.highlight_visible()
+    
+    def schedule_visible(self) -> None:
+        """在空闲时高亮当前可见区域（滚动回调中调用，连续触发只执行一次）"""
+        if self._pending_id is not None or not self._lazy:
+            return
+        self._pending_id = self.text_widget.after_idle(self._run_pending)
+    
+    def highlight_visible(self) -> None:
+        """高亮可见区域及上下预留范围内尚未高亮的行块"""
+        text_widget = self.text_widget
+        if not text_widget.winfo_exists():
+            return
+        
+        # 编辑可能增减行数，按widget当前的行数计算，新增到末尾的行也能被高亮
+        self._line_count = int(text_widget.index("end-1c").split('.')[0])
+        first_line = int(text_widget.index("@0,0").split('.')[0])
+        last_line = int(text_widget.index(f"@0,{text_widget.winfo_height()}").split('.')[0])
+        first_block = (max(first_line - HIGHLIGHT_MARGIN_LINES, 1) - 1) // HIGHLIGHT_BLOCK_LINES
+        last_block = (min(last_line + HIGHLIGHT_MARGIN_LINES, self._line_count) - 1) // HIGHLIGHT_BLOCK_LINES
+        
+        ranges_by_tag: Dict[str, List[str]] = {tag: [] for tag in HIGHLIGHT_TAGS}
+        for block in range(first_block, last_block + 1):
+            if block in self._highlighted_blocks:
+                continue
+            self._highlighted_blocks.add(block)
+            start_line = block * HIGHLIGHT_BLOCK_LINES + 1
+            end_line = start_line + HIGHLIGHT_BLOCK_LINES - 1
+            # 从widget读取当前文本，用户编辑过的内容也能正确定位
+            block_text = text_widget.get(f"{start_line}.0", f"{end_line}.end")
+            _collect_highlight_ranges(block_text, start_line, ranges_by_tag)
+        _add_highlight_ranges(text_widget, ranges_by_tag)
+    
+    def _run_pending(self) -> None:
+        """执行被合并的可见区域高亮"""
+        self._pending_id = None
+        self.highlight_visible()
+    
+    def _cancel_pending(self) -> None:
+        """取消尚未执行的可见区域高亮"""
+        if self._pending_id is not None:
+            self.text_widget.after_cancel(self._pending_id)
+            self._pending_id = None
@@ -3,10 +3,9 @@
 提供运行时模式下的内存注入和刷新功能
 """
 
-import asyncio
 import json
 import logging
-import threading
+from concurrent.futures import Future
 from typing import Any, Callable, Dict, Optional
 
 import tkinter as tk
@@ -14,6 +13,8 @@ from tkinter import messagebox
 
 from src.utils.ui_utils import showerror_relative, showinfo_relative
 
+from .async_loop import run_coroutine_for_window
+
 logger = logging.getLogger(__name__)
 
 # 常量定义
@@ -42,6 +43,9 @@ class RuntimeInjector:
         self.service = service
         self.ws_url = ws_url
         self.t = t_func
+        # 读取请求的序号和进行中的读取，新的读取会取代旧的
+        self._read_seq = 0
+        self._read_future: Optional[Future] = None
     
     def check_changes_and_inject_async(
         self,
@@ -56,46 +60,40 @@ class RuntimeInjector:
             original_save_data: 原始存档数据
             on_complete: 完成回调函数 (success, error, edited_data)
         """
-        def check_and_inject_in_thread():
-            """在后台线程中检查变更并执行注入"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                has_changes, changes_info = loop.run_until_complete(
-                    self.service.check_sf_changes(
-                        self.ws_url,
-                        original_save_data
-                    )
-                )
-                changes_text = changes_info.get("changes_text", "") if has_changes else ""
-                
-                if has_changes:
-                    # 在主线程中显示警告
-                    user_continue = messagebox.askyesno(
-                        self.t("warning"),
-                        self.t("runtime_modify_sf_changes_detected").format(changes=changes_text),
-                        parent=self.window
-                    )
-                    if not user_continue:
-                        self.window.after(0, lambda: on_complete(False, None, edited_data))
-                        return
-                
-                # 执行注入
-                success, error = loop.run_until_complete(
-                    self.service.inject_and_save_sf(
-                        self.ws_url,
-                        edited_data
-                    )
+        def on_inject_done(result: Any, exception: Optional[BaseException]) -> None:
+            """注入完成后在主线程中回调"""
+            if exception is not None:
+                logger.error(f"Error in check_and_inject: {exception}", exc_info=exception)
+                on_complete(False, str(exception), edited_data)
+                return
+            success, error = result
+            on_complete(success, error, edited_data)
+        
+        def on_check_done(result: Any, exception: Optional[BaseException]) -> None:
+            """变更检查完成后在主线程中确认并提交注入"""
+            if exception is not None:
+                on_inject_done(None, exception)
+                return
+            has_changes, changes_info = result
+            
+            if has_changes:
+                changes_text = changes_info.get("changes_text", "")
+                user_continue = messagebox.askyesno(
+                    self.t("warning"),
+                    self.t("runtime_modify_sf_changes_detected").format(changes=changes_text),
+                    parent=self.window
                 )
-                self.window.after(0, lambda: on_complete(success, error, edited_data))
-            except Exception as e:
-                logger.error(f"Error in check_and_inject: {e}", exc_info=True)
-                self.window.after(0, lambda: on_complete(False, str(e), edited_data))
-            finally:
-                loop.close()
+                if not user_continue:
+                    on_complete(False, None, edited_data)
+                    return
+            
+            # 执行注入（没有外部变更时复用检查时读到的数据作为合并基础）
+            current_data = None if has_changes else changes_info.get("current_data")
+            inject_coro = self.service.inject_and_save_sf(self.ws_url, edited_data, current_data)
+            run_coroutine_for_window(self.window, inject_coro, on_inject_done)
         
-        thread = threading.Thread(target=check_and_inject_in_thread, daemon=True)
-        thread.start()
+        check_coro = self.service.check_sf_changes(self.ws_url, original_save_data)
+        run_coroutine_for_window(self.window, check_coro, on_check_done)
     
     def read_save_data_async(
         self,
@@ -106,23 +104,26 @@ class RuntimeInjector:
         Args:
             on_complete: 完成回调函数 (data, error)
         """
-        def read_in_thread():
-            """在后台线程中读取数据"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                data, error = loop.run_until_complete(
-                    self.service.read_tyrano_variable_sf(self.ws_url)
-                )
-                self.window.after(0, lambda: on_complete(data, error))
-            except Exception as e:
-                logger.error(f"Error reading save data: {e}", exc_info=True)
-                self.window.after(0, lambda: on_complete(None, str(e)))
-            finally:
-                loop.close()
+        # 之前的读取结果已不再需要，尚未完成时直接取消
+        self._read_seq += 1
+        read_seq = self._read_seq
+        if self._read_future is not None:
+            self._read_future.cancel()
+        
+        def on_read_done(result: Any, exception: Optional[BaseException]) -> None:
+            """读取完成后在主线程中回调（已被新读取取代时忽略）"""
+            if read_seq != self._read_seq:
+                return
+            self._read_future = None
+            if exception is not None:
+                logger.error(f"Error reading save data: {exception}", exc_info=exception)
+                on_complete(None, str(exception))
+                return
+            data, error = result
+            on_complete(data, error)
         
-        thread = threading.Thread(target=read_in_thread, daemon=True)
-        thread.start()
+        read_coro = self.service.read_tyrano_variable_sf(self.ws_url)
+        self._read_future = run_coroutine_for_window(self.window, read_coro, on_read_done)
     
     def refresh_after_inject(
         self,
@@ -133,25 +134,19 @@ class RuntimeInjector:
         Args:
             on_complete: 完成回调函数 (data, error)
         """
-        def read_in_thread():
-            """在后台线程中读取数据"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                data, read_error = loop.run_until_complete(
-                    self.service.read_tyrano_variable_sf(self.ws_url)
-                )
-                self.window.after(0, lambda: on_complete(data, read_error))
-            except Exception as e:
-                logger.error(f"Error refreshing after inject: {e}", exc_info=True)
-                self.window.after(0, lambda: on_complete(None, str(e)))
-            finally:
-                loop.close()
+        def on_read_done(result: Any, exception: Optional[BaseException]) -> None:
+            """读取完成后在主线程中回调"""
+            if exception is not None:
+                logger.error(f"Error refreshing after inject: {exception}", exc_info=exception)
+                on_complete(None, str(exception))
+                return
+            data, read_error = result
+            on_complete(data, read_error)
         
         # 延迟一点再刷新，确保注入操作完全完成
         def start_refresh():
-            thread = threading.Thread(target=read_in_thread, daemon=True)
-            thread.start()
+            read_coro = self.service.read_tyrano_variable_sf(self.ws_url)
+            run_coroutine_for_window(self.window, read_coro, on_read_done)
         
         self.window.after(_REFRESH_AFTER_INJECT_DELAY_MS, start_refresh)
 
@@ -3,9 +3,8 @@
 负责运行时模式下的数据注入、刷新和错误处理。
 """
 
-import asyncio
 import logging
-import threading
+from concurrent.futures import Future
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import tkinter as tk
@@ -13,6 +12,7 @@ from tkinter import messagebox
 
 from src.utils.ui_utils import showerror_relative, showinfo_relative
 
+from .async_loop import run_coroutine_for_window
 from .config import REFRESH_AFTER_INJECT_DELAY_MS
 from .models import ViewerConfig
 
@@ -38,6 +38,15 @@ class RuntimeInjectorService:
         self.window = window
         self.viewer_config = viewer_config
         self.t = translate_func
+        
+        # 注入后刷新的合并状态
+        self._pending_refresh_id: Optional[str] = None
+        self._refresh_in_flight = False
+        self._refresh_requested_again = False
+        self._refresh_callback: Optional[Callable[[Optional[Dict[str, Any]], Optional[str]], None]] = None
+        # 手动刷新的序号和进行中的读取，新的刷新会取代旧的
+        self._read_seq = 0
+        self._read_future: Optional[Future] = None
     
     def is_available(self) -> bool:
         """检查运行时服务是否可用
@@ -110,20 +119,28 @@ class RuntimeInjectorService:
             read_method = self.viewer_config.service.read_tyrano_variable_sf
             error_key = "runtime_modify_sf_read_failed"
         
-        def read_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                data, error = loop.run_until_complete(read_method(self.viewer_config.ws_url))
-                self.window.after(0, lambda: self._on_read_complete(data, error, error_key, on_complete))
-            except Exception as e:
-                logger.error(f"Error reading runtime data: {e}", exc_info=True)
-                self.window.after(0, lambda: on_complete(None, str(e)))
-            finally:
-                loop.close()
+        # 之前的读取结果已不再需要，尚未完成时直接取消
+        self._read_seq += 1
+        read_seq = self._read_seq
+        if self._read_future is not None:
+            self._read_future.cancel()
         
-        thread = threading.Thread(target=read_in_thread, daemon=True)
-        thread.start()
+        def on_read_done(result: Any, exception: Optional[BaseException]) -> None:
+            if read_seq != self._read_seq:
+                return
+            self._read_future = None
+            if exception is not None:
+                logger.error(f"Error reading runtime data: {exception}", exc_info=exception)
+                on_complete(None, str(exception))
+                return
+            data, error = result
+            self._on_read_complete(data, error, error_key, on_complete)
+        
+        self._read_future = run_coroutine_for_window(
+            self.window,
+            read_method(self.viewer_config.ws_url),
+            on_read_done
+        )
     
     def check_changes_and_inject(
         self,
@@ -132,61 +149,62 @@ class RuntimeInjectorService:
         on_success: Callable[[Dict[str, Any]], None],
         on_error: Callable[[str], None]
     ) -> None:
-        """检查变更并执行注入"""
-        def check_and_inject_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                has_changes, changes_info = loop.run_until_complete(
-                    self.viewer_config.service.check_sf_changes(
-                        self.viewer_config.ws_url,
-                        original_save_data
-                    )
-                )
-                changes_text = changes_info.get("changes_text", "") if has_changes else ""
-                
-                if has_changes:
-                    # 在主线程中显示警告
-                    user_continue = messagebox.askyesno(
-                        self.t("warning"),
-                        self.t("runtime_modify_sf_changes_detected").format(changes=changes_text),
-                        parent=self.window
-                    )
-                    if not user_continue:
-                        self.window.after(0, lambda: on_error(self.t("user_cancelled")))
-                        return
-                
-                success, error = loop.run_until_complete(
-                    self.viewer_config.service.inject_and_save_sf(
-                        self.viewer_config.ws_url,
-                        edited_data
-                    )
-                )
-                
-                if success:
-                    self.window.after(0, lambda: self._on_inject_success(edited_data, on_success))
-                else:
-                    error_msg = error or self.t("runtime_modify_sf_error_unknown")
-                    showerror_relative(
-                        self.window,
-                        self.t("error"),
-                        self.t("runtime_modify_sf_inject_failed").format(error=error_msg)
-                    )
-                    self.window.after(0, lambda: on_error(error_msg))
-            except Exception as e:
-                logger.error(f"Error in check_and_inject: {e}", exc_info=True)
-                error_msg = str(e)
-                showerror_relative(
-                    self.window,
-                    self.t("error"),
-                    self.t("runtime_modify_sf_inject_failed").format(error=error_msg)
+        """检查变更并执行注入
+        
+        检查和注入分两步提交到后台事件循环，中间的确认对话框在主线程中显示。
+        """
+        def on_inject_failed(error_msg: str) -> None:
+            showerror_relative(
+                self.window,
+                self.t("error"),
+                self.t("runtime_modify_sf_inject_failed").format(error=error_msg)
+            )
+            on_error(error_msg)
+        
+        def on_inject_done(result: Any, exception: Optional[BaseException]) -> None:
+            if exception is not None:
+                logger.error(f"Error in check_and_inject: {exception}", exc_info=exception)
+                on_inject_failed(str(exception))
+                return
+            success, error = result
+            if success:
+                self._on_inject_success(edited_data, on_success)
+            else:
+                on_inject_failed(error or self.t("runtime_modify_sf_error_unknown"))
+        
+        def on_check_done(result: Any, exception: Optional[BaseException]) -> None:
+            if exception is not None:
+                logger.error(f"Error in check_and_inject: {exception}", exc_info=exception)
+                on_inject_failed(str(exception))
+                return
+            has_changes, changes_info = result
+            
+            if has_changes:
+                changes_text = changes_info.get("changes_text", "")
+                user_continue = messagebox.askyesno(
+                    self.t("warning"),
+                    self.t("runtime_modify_sf_changes_detected").format(changes=changes_text),
+                    parent=self.window
                 )
-                self.window.after(0, lambda: on_error(error_msg))
-            finally:
-                loop.close()
+                if not user_continue:
+                    on_error(self.t("user_cancelled"))
+                    return
+            
+            # 没有外部变更时，检查时读到的数据就是注入的合并基础，不再重复读取；
+            # 用户确认过变更则重新读取，确认期间游戏内存可能又有变化
+            current_data = None if has_changes else changes_info.get("current_data")
+            inject_coro = self.viewer_config.service.inject_and_save_sf(
+                self.viewer_config.ws_url,
+                edited_data,
+                current_data
+            )
+            run_coroutine_for_window(self.window, inject_coro, on_inject_done)
         
-        thread = threading.Thread(target=check_and_inject_in_thread, daemon=True)
-        thread.start()
+        check_coro = self.viewer_config.service.check_sf_changes(
+            self.viewer_config.ws_url,
+            original_save_data
+        )
+        run_coroutine_for_window(self.window, check_coro, on_check_done)
     
     def _inject_kag_stat(
         self,
@@ -213,7 +231,7 @@ class RuntimeInjectorService:
                 )
                 on_error(error_msg)
         
-        self._run_async_in_thread(inject_coro, on_complete)
+        self._run_async(inject_coro, on_complete)
     
     def _on_inject_success(
         self,
@@ -262,65 +280,77 @@ class RuntimeInjectorService:
         self,
         on_complete: Callable[[Optional[Dict[str, Any]], Optional[str]], None]
     ) -> None:
-        """注入后刷新数据"""
+        """注入后刷新数据
+        
+        短时间内多次调用只执行最后一次，回调也只使用最后一次传入的；
+        已有读取在进行时，等它完成后再补读一次，过期的结果不再回调。
+        
+        Args:
+            on_complete: 完成回调 (data, error)
+        """
         if not self.is_available():
             on_complete(None, self.t("runtime_modify_sf_game_not_running"))
             return
         
-        def read_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                if self.viewer_config.inject_method == "kag_stat":
-                    read_method = self.viewer_config.service.read_tyrano_kag_stat
-                else:
-                    read_method = self.viewer_config.service.read_tyrano_variable_sf
-                
-                data, read_error = loop.run_until_complete(read_method(self.viewer_config.ws_url))
-                self.window.after(0, lambda: on_complete(data, read_error))
-            except Exception as e:
-                logger.error(f"Error refreshing after inject: {e}", exc_info=True)
-                self.window.after(0, lambda: on_complete(None, str(e)))
-            finally:
-                loop.close()
+        self._refresh_callback = on_complete
+        if self._pending_refresh_id is not None:
+            self.window.after_cancel(self._pending_refresh_id)
+        self._pending_refresh_id = self.window.after(REFRESH_AFTER_INJECT_DELAY_MS, self._start_refresh)
+    
+    def _start_refresh(self) -> None:
+        """执行合并后的注入后刷新"""
+        self._pending_refresh_id = None
+        if self._refresh_in_flight:
+            self._refresh_requested_again = True
+            return
         
-        def start_refresh():
-            thread = threading.Thread(target=read_in_thread, daemon=True)
-            thread.start()
+        if self.viewer_config.inject_method == "kag_stat":
+            read_method = self.viewer_config.service.read_tyrano_kag_stat
+        else:
+            read_method = self.viewer_config.service.read_tyrano_variable_sf
+        
+        def on_read_done(result: Any, exception: Optional[BaseException]) -> None:
+            self._refresh_in_flight = False
+            if self._refresh_requested_again:
+                # 读取期间又有新的刷新请求，本次结果已过期
+                self._refresh_requested_again = False
+                self._start_refresh()
+                return
+            if self._pending_refresh_id is not None:
+                # 新的刷新已排队，结果交给它
+                return
+            
+            on_complete = self._refresh_callback
+            self._refresh_callback = None
+            if on_complete is None:
+                return
+            if exception is not None:
+                logger.error(f"Error refreshing after inject: {exception}", exc_info=exception)
+                on_complete(None, str(exception))
+                return
+            data, read_error = result
+            on_complete(data, read_error)
         
-        self.window.after(REFRESH_AFTER_INJECT_DELAY_MS, start_refresh)
+        self._refresh_in_flight = True
+        run_coroutine_for_window(self.window, read_method(self.viewer_config.ws_url), on_read_done)
     
-    def _run_async_in_thread(
+    def _run_async(
         self,
         coro: Any,
         on_complete: Callable[[bool, Optional[str]], None]
     ) -> None:
-        """在后台线程中运行异步协程
+        """在后台事件循环中运行异步协程
         
         Args:
             coro: 异步协程对象
             on_complete: 完成回调 (success, error)
         """
-        """在后台线程中运行异步协程"""
-        def run_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result, error = loop.run_until_complete(coro)
-                self.window.after(0, lambda: on_complete(result, error))
-            except Exception as e:
-                logger.exception("Unexpected error in async thread")
-                self.window.after(0, lambda: on_complete(False, str(e)))
-            finally:
-                pending = asyncio.all_tasks(loop)
-                if pending:
-                    for task in pending:
-                        task.cancel()
-                    try:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                    except Exception as gather_error:
-                        logger.debug("Error gathering pending tasks: %s", gather_error)
-                loop.close()
+        def on_done(result: Any, exception: Optional[BaseException]) -> None:
+            if exception is not None:
+                logger.error("Unexpected error in async task", exc_info=exception)
+                on_complete(False, str(exception))
+                return
+            success, error = result
+            on_complete(success, error)
         
-        thread = threading.Thread(target=run_in_thread, daemon=True)
-        thread.start()
+        run_coroutine_for_window(self.window, coro, on_done)
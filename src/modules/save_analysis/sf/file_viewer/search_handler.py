@@ -3,8 +3,10 @@
 负责文本搜索、高亮和导航功能。
 """
 
+import functools
 import logging
-from typing import Callable, List, Tuple
+import re
+from typing import Callable, List, Optional, Pattern, Tuple
 
 import tkinter as tk
 from tkinter import ttk
@@ -13,6 +15,18 @@ from .config import SEARCH_HIGHLIGHT_COLOR
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=32)
+def _compile_search_pattern(search_term: str) -> Pattern[str]:
+    """编译忽略大小写的字面量搜索正则（按搜索词缓存）
+    
+    Args:
+        search_term: 搜索词
+        
+    Returns:
+        编译后的正则
+    """
+    return re.compile(re.escape(search_term), re.IGNORECASE)
+
 
 class SearchHandler:
     """搜索处理器，管理文本搜索和高亮"""
@@ -38,6 +52,11 @@ class SearchHandler:
         self.t = translate_func
         self.search_matches: List[Tuple[str, str]] = []
         self.current_search_pos = 0
+        # 上次搜索的搜索词和文本内容，两者都未变化时直接在已有结果中导航
+        self._searched_term: Optional[str] = None
+        self._searched_content = ""
+        # 高亮标签只配置一次，之后每次搜索只清除其范围
+        self.text_widget.tag_config("search_highlight", background=SEARCH_HIGHLIGHT_COLOR)
     
     def find_text(self, direction: str = "next") -> None:
         """搜索文本并高亮显示
@@ -50,35 +69,27 @@ class SearchHandler:
             self.results_label.config(text="")
             return
         
-        was_disabled = self.text_widget.cget("state") == "disabled"
-        if was_disabled:
-            self.text_widget.config(state="normal")
-        
+        # 标签、标记和滚动在 disabled 状态下同样可用，无需临时切换编辑状态
         try:
             content = self.text_widget.get("1.0", "end-1c")
-            self.text_widget.tag_delete("search_highlight")
-            self.text_widget.tag_config("search_highlight", background=SEARCH_HIGHLIGHT_COLOR)
-            
-            self.search_matches.clear()
-            start_pos = "1.0"
-            
-            while True:
-                pos = self.text_widget.search(search_term, start_pos, "end", nocase=True)
-                if not pos:
-                    break
-                end_pos = f"{pos}+{len(search_term)}c"
-                self.search_matches.append((pos, end_pos))
-                self.text_widget.tag_add("search_highlight", pos, end_pos)
-                start_pos = end_pos
+            # 连续按上一个/下一个时搜索词和内容都不变，只需移动到相邻的匹配项
+            if search_term != self._searched_term or content != self._searched_content:
+                self._search_all(search_term, content)
             
             if self.search_matches:
+                # 到达两端时回绕；结果变少后旧位置可能越界，同样回到开头或末尾
+                match_count = len(self.search_matches)
                 if direction == "next":
-                    self.current_search_pos = (self.current_search_pos + 1) % len(self.search_matches)
+                    next_pos = self.current_search_pos + 1
+                    if next_pos >= match_count:
+                        next_pos = 0
                 else:
-                    self.current_search_pos = (self.current_search_pos - 1) % len(self.search_matches)
+                    next_pos = self.current_search_pos - 1
+                    if next_pos < 0 or next_pos >= match_count:
+                        next_pos = match_count - 1
+                self.current_search_pos = next_pos
                 
                 pos, end_pos = self.search_matches[self.current_search_pos]
-                self.text_widget.see(pos)
                 self.text_widget.mark_set("insert", pos)
                 self.text_widget.see(pos)
                 
@@ -90,9 +101,41 @@ class SearchHandler:
         except tk.TclError as e:
             logger.warning(f"Search error: {e}")
             self.results_label.config(text="")
-        finally:
-            if was_disabled:
-                self.text_widget.config(state="disabled")
+    
+    def _search_all(self, search_term: str, content: str) -> None:
+        """查找全部匹配项并高亮，结果保存到 search_matches
+        
+        Args:
+            search_term: 搜索词
+            content: 文本组件的全部内容
+        """
+        self.text_widget.tag_remove("search_highlight", "1.0", "end")
+        self.search_matches.clear()
+        
+        # 在 Python 中一次扫描全部内容；行号只在相邻两个匹配之间增量统计换行，
+        # 不需要为整个文档建立行起始偏移表（搜索词不含换行，匹配不会跨行）
+        highlight_ranges: List[str] = []
+        line_num = 1
+        line_start = 0
+        scanned = 0
+        for match in _compile_search_pattern(search_term).finditer(content):
+            start = match.start()
+            newlines = content.count('\n', scanned, start)
+            if newlines:
+                line_num += newlines
+                line_start = content.rfind('\n', scanned, start) + 1
+            scanned = start
+            pos = f"{line_num}.{start - line_start}"
+            end_pos = f"{line_num}.{match.end() - line_start}"
+            self.search_matches.append((pos, end_pos))
+            highlight_ranges.append(pos)
+            highlight_ranges.append(end_pos)
+        
+        if highlight_ranges:
+            self.text_widget.tag_add("search_highlight", *highlight_ranges)
+        
+        self._searched_term = search_term
+        self._searched_content = content
     
     def find_next(self) -> None:
         """查找下一个匹配项"""
@@ -107,8 +150,10 @@ class SearchHandler:
         if not self.text_widget.winfo_exists():
             return
         
-        self.text_widget.tag_delete("search_highlight")
+        self.text_widget.tag_remove("search_highlight", "1.0", "end")
         self.search_matches.clear()
         self.current_search_pos = 0
+        self._searched_term = None
+        self._searched_content = ""
         if self.results_label and self.results_label.winfo_exists():
             self.results_label.config(text="")
@@ -4,7 +4,7 @@
 """
 
 import logging
-from typing import Callable, Tuple
+from typing import Callable, List, Tuple
 
 import tkinter as tk
 from tkinter import Scrollbar, ttk
@@ -40,6 +40,12 @@ class UIBuilder:
         """
         self.viewer_window = viewer_window
         self.t = translate_func
+        # 行号组件当前显示的行数，行数不变时无需重写行号
+        self._gutter_line_count = 0
+        # 文本编辑器视图滚动后需要通知的回调
+        self._scroll_listeners: List[Callable[[], None]] = []
+        # 行号滚动同步是否已排入空闲任务（连续滚动只同步一次）
+        self._sync_pending = False
     
     def setup_modal_styles(self) -> None:
         """设置模态窗口样式"""
@@ -164,18 +170,28 @@ class UIBuilder:
         h_scrollbar.pack(side="bottom", fill="x")
         
         # 配置滚动同步函数
-        def sync_line_numbers(*args):
-            """同步行号滚动位置"""
+        def do_sync_line_numbers():
+            """执行被合并的行号滚动同步"""
+            self._sync_pending = False
             if line_numbers.winfo_exists() and text_widget.winfo_exists():
                 try:
                     line_numbers.yview_moveto(text_widget.yview()[0])
                 except (tk.TclError, AttributeError):
                     pass
         
+        def sync_line_numbers(*args):
+            """在空闲时同步行号滚动位置，快速滚动产生的多次请求只执行一次"""
+            if self._sync_pending:
+                return
+            self._sync_pending = True
+            text_widget.after_idle(do_sync_line_numbers)
+        
         def yscroll_command(*args):
             """文本编辑器垂直滚动回调，更新滚动条并同步行号"""
             v_scrollbar.set(*args)
             sync_line_numbers()
+            for listener in self._scroll_listeners:
+                listener()
         
         # 创建文本编辑器
         text_widget = tk.Text(
@@ -207,6 +223,14 @@ class UIBuilder:
         return text_widget, line_numbers
 
 
+    def add_scroll_listener(self, listener: Callable[[], None]) -> None:
+        """注册文本编辑器垂直滚动时的回调
+        
+        Args:
+            listener: 无参数回调，应尽快返回（耗时工作自行推迟到空闲时执行）
+        """
+        self._scroll_listeners.append(listener)
+    
     def update_line_numbers(
         self,
         text_widget: tk.Text,
@@ -221,12 +245,20 @@ class UIBuilder:
         if not text_widget.winfo_exists() or not line_numbers.winfo_exists():
             return
         
-        line_numbers.config(state="normal")
-        line_numbers.delete("1.0", "end")
+        # 最后一个字符的索引即可得到行数，不需要取出全部文本
+        line_count = int(text_widget.index("end-1c").split('.')[0])
+        shown_count = self._gutter_line_count
         
-        content = text_widget.get("1.0", "end-1c")
-        line_count = content.count('\n') + 1 if content else 1
+        if line_count != shown_count:
+            line_numbers.config(state="normal")
+            if line_count > shown_count:
+                # 只追加新增的行号
+                new_numbers = "\n".join(map(str, range(shown_count + 1, line_count + 1)))
+                line_numbers.insert("end-1c", new_numbers + "\n")
+            else:
+                # 只删除多出的行号
+                line_numbers.delete(f"{line_count + 1}.0", "end-1c")
+            line_numbers.config(state="disabled")
+            self._gutter_line_count = line_count
         
-        line_numbers.insert("end", "\n".join(str(i) for i in range(1, line_count + 1)) + "\n")
-        line_numbers.config(state="disabled")
         line_numbers.yview_moveto(text_widget.yview()[0])
@@ -12,13 +12,10 @@
 - file_viewer.search_handler: 搜索功能
 """
 
-import asyncio
 import json
 import logging
-import threading
-import urllib.parse
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Coroutine, Dict, List, Literal, Optional, Tuple
 
 import tkinter as tk
 from tkinter import Scrollbar, messagebox, ttk
@@ -34,12 +31,13 @@ from src.utils.ui_utils import (
 from src.utils.hint_animation import HintAnimation
 from src.modules.screenshot.animation_constants import CHECKBOX_STYLE_NORMAL, CHECKBOX_STYLE_HINT
 
-from .file_viewer.json_highlighter import apply_json_syntax_highlight
+from .file_viewer.json_highlighter import ViewportHighlighter
 from .file_viewer.config import (
     DEFAULT_SF_COLLAPSED_FIELDS,
     SAVE_FILE_NAME,
     CLOSE_CALLBACK_DELAY_MS,
     REFRESH_AFTER_INJECT_DELAY_MS,
+    TEXT_CHANGE_DEBOUNCE_MS,
     SINGLE_LINE_LIST_FIELDS,
     DEFAULT_WINDOW_SIZE,
     HINT_WRAPLENGTH,
@@ -54,11 +52,19 @@ from .file_viewer.viewer_registry import (
     is_viewer_alive,
 )
 from .file_viewer.json_formatter import JSONFormatter
-from .file_viewer.file_saver import FileSaver
+from .file_viewer.file_saver import FileSaver, write_encoded_save
 from .file_viewer.runtime_injector_service import RuntimeInjectorService
+from .file_viewer.async_loop import run_coroutine_for_window, submit_blocking
 from .file_viewer.search_handler import SearchHandler
 from .file_viewer.ui_builder import UIBuilder
-from .file_viewer.editor_controller import EditorController
+from .file_viewer.editor_controller import (
+    EditorController,
+    TextRange,
+    find_changed_line_ranges,
+    find_text_ranges,
+    parse_text_index,
+    position_in_ranges,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +139,10 @@ class SaveFileViewer:
         self.viewer_config = viewer_config or ViewerConfig()
         self.original_save_data = JSONFormatter._deep_copy_data(save_data)
         self._data_was_saved = False  # 标志位：是否保存过数据
+        self._save_in_progress = False  # 标志位：后台线程是否正在写入存档文件
+        # 不折叠时的完整JSON缓存及其对应的save_data对象
+        self._full_json: str = ""
+        self._full_json_source: Optional[Dict[str, Any]] = None
         
         # 初始化服务模块
         self.json_formatter = JSONFormatter(
@@ -173,11 +183,8 @@ class SaveFileViewer:
         self.viewer_window.bind("<Destroy>", on_destroy)
     
     def _find_root_window(self, window: tk.Widget) -> tk.Tk:
-        """查找根窗口"""
-        root = window
-        while not isinstance(root, tk.Tk) and hasattr(root, 'master'):
-            root = root.master
-        return root
+        """查找根窗口（直接从Tk的组件表中取 "." 对应的根窗口，不逐级遍历master）"""
+        return window.nametowidget('.')
     
     def _create_viewer_window(self, root_window: tk.Tk) -> tk.Toplevel:
         """创建查看器窗口"""
@@ -216,30 +223,37 @@ class SaveFileViewer:
         self.line_numbers = line_numbers
         self.text_widget = text_widget
         
-        # 应用语法高亮
-        apply_json_syntax_highlight(text_widget, initial_content)
+        # 应用语法高亮（大文档只高亮可见区域，滚动或窗口尺寸变化时补全）
+        self.json_highlighter = ViewportHighlighter(text_widget)
+        self.json_highlighter.set_content(initial_content)
+        self.ui_builder.add_scroll_listener(self.json_highlighter.schedule_visible)
+        text_widget.bind("<Configure>", lambda e: self.json_highlighter.schedule_visible(), add="+")
         self._update_line_numbers(text_widget, line_numbers)
         
         # 设置工具栏控件
         self._setup_toolbar_controls(toolbar, text_widget, line_numbers)
     
+    def _get_full_json(self) -> str:
+        """获取不折叠的完整JSON文本
+        
+        save_data 只会被整体替换，对象未变时直接复用上次序列化的结果。
+        
+        Returns:
+            缩进格式的完整JSON文本
+        """
+        if self._full_json_source is not self.save_data:
+            self._full_json = json.dumps(self.save_data, ensure_ascii=False, indent=2)
+            self._full_json_source = self.save_data
+        return self._full_json
+    
     def _format_display_data(self) -> str:
         """格式化显示数据"""
         return self.json_formatter.format_display_data(self.save_data)
     
     
     def _update_line_numbers(self, text_widget: tk.Text, line_numbers: tk.Text) -> None:
-        """更新行号显示"""
-        if hasattr(self, 'ui_builder'):
-            self.ui_builder.update_line_numbers(text_widget, line_numbers)
-        else:
-            line_numbers.config(state="normal")
-            line_numbers.delete("1.0", "end")
-            content = text_widget.get("1.0", "end-1c")
-            line_count = content.count('\n') + 1 if content else 1
-            line_numbers.insert("end", "\n".join(str(i) for i in range(1, line_count + 1)) + "\n")
-            line_numbers.config(state="disabled")
-            line_numbers.yview_moveto(text_widget.yview()[0])
+        """更新行号显示（由 UIBuilder 按行数差增量更新）"""
+        self.ui_builder.update_line_numbers(text_widget, line_numbers)
     
     def _setup_toolbar_controls(
         self,
@@ -255,29 +269,20 @@ class SaveFileViewer:
         self.save_button: Optional[ttk.Button] = None
         
         original_content = text_widget.get("1.0", "end-1c")
-        collapsed_text_ranges: List[Tuple[str, str]] = []
+        collapsed_text_ranges: List[TextRange] = []
         
-        def update_collapsed_ranges():
+        def update_collapsed_ranges(content: Optional[str] = None):
             collapsed_text_ranges.clear()
             if not disable_collapse_var.get():
                 collapsed_text = self.t("collapsed_field_text")
-                content = text_widget.get("1.0", "end-1c")
-                start_pos = "1.0"
-                while True:
-                    pos = text_widget.search(collapsed_text, start_pos, "end", exact=True)
-                    if not pos:
-                        break
-                    end_pos = f"{pos}+{len(collapsed_text)}c"
-                    collapsed_text_ranges.append((pos, end_pos))
-                    start_pos = end_pos
+                if content is None:
+                    content = text_widget.get("1.0", "end-1c")
+                collapsed_text_ranges.extend(find_text_ranges(content, collapsed_text))
         
         def is_in_collapsed_range(pos: str) -> bool:
             if disable_collapse_var.get():
                 return False
-            return any(
-                text_widget.compare(start, "<=", pos) and text_widget.compare(pos, "<", end)
-                for start, end in collapsed_text_ranges
-            )
+            return position_in_ranges(collapsed_text_ranges, parse_text_index(pos))
         
         hint_animation: Optional[HintAnimation] = None
         
@@ -294,8 +299,8 @@ class SaveFileViewer:
                             hint_animation.trigger()
                 return "break"
             
-            cursor_pos = text_widget.index("insert")
-            if is_in_collapsed_range(cursor_pos):
+            # 没有折叠文本时不必查询光标位置，省去每次按键的一次Tcl调用
+            if collapsed_text_ranges and is_in_collapsed_range(text_widget.index("insert")):
                 showwarning_relative(
                     self.viewer_window,
                     self.t("cannot_edit_collapsed"),
@@ -304,11 +309,30 @@ class SaveFileViewer:
                 return "break"
             return None
         
+        # 连续输入时<<Modified>>会频繁触发；每次按键之间程序都会空闲，after_idle合并不了，
+        # 因此延迟一小段时间，在输入停顿后只处理最后一次
+        pending_text_change: Optional[str] = None
+        
         def on_text_change(event=None):
+            nonlocal pending_text_change
+            # <<Modified>>只在modified标志变化时触发，处理后清除标志才能收到下一次修改；
+            # 清除标志本身也会触发一次，此时标志为False，直接忽略
+            if not text_widget.edit_modified():
+                return
+            text_widget.edit_modified(False)
+            if pending_text_change is not None:
+                self.viewer_window.after_cancel(pending_text_change)
+            pending_text_change = self.viewer_window.after(TEXT_CHANGE_DEBOUNCE_MS, process_text_change)
+        
+        def process_text_change():
+            nonlocal pending_text_change
+            pending_text_change = None
+            if not text_widget.winfo_exists():
+                return
+            self._update_line_numbers(text_widget, self.line_numbers)
             if not enable_edit_var.get():
                 return
-            cursor_pos = text_widget.index("insert")
-            if is_in_collapsed_range(cursor_pos):
+            if collapsed_text_ranges and is_in_collapsed_range(text_widget.index("insert")):
                 showwarning_relative(
                     self.viewer_window,
                     self.t("cannot_edit_collapsed"),
@@ -316,29 +340,42 @@ class SaveFileViewer:
                 )
                 if text_widget.tk.call(text_widget._w, 'edit', 'canundo'):
                     text_widget.edit_undo()
+            # 撤销之后再读取，两处共用同一份内容，整个文档只需跨Tcl取一次
+            current_content = text_widget.get("1.0", "end-1c")
+            detect_and_highlight_changes(current_content)
+            # 只有内容变化才会移动折叠文本的位置，在这里重新扫描，而不是每次点击都扫描
+            update_collapsed_ranges(current_content)
         
         text_widget.bind("<KeyPress>", on_text_edit)
-        text_widget.bind("<Button-1>", lambda e: update_collapsed_ranges())
         text_widget.bind("<<Modified>>", on_text_change)
+        # 初始内容不算修改
+        text_widget.edit_modified(False)
+        
+        # 原始内容按行拆分的缓存，original_content被重新赋值后才重新拆分
+        split_original: Optional[str] = None
+        original_lines: List[str] = []
         
-        def detect_and_highlight_changes():
+        def get_original_lines() -> List[str]:
+            nonlocal split_original, original_lines
+            if split_original is not original_content:
+                original_lines = original_content.split('\n')
+                split_original = original_content
+            return original_lines
+        
+        def detect_and_highlight_changes(current_content: Optional[str] = None):
             if not enable_edit_var.get():
                 return
             text_widget.tag_remove("user_edit", "1.0", "end")
-            current_content = text_widget.get("1.0", "end-1c")
-            if current_content != original_content:
-                original_lines = original_content.split('\n')
-                current_lines = current_content.split('\n')
-                max_lines = max(len(original_lines), len(current_lines))
-                for i in range(max_lines):
-                    original_line = original_lines[i] if i < len(original_lines) else ""
-                    current_line = current_lines[i] if i < len(current_lines) else ""
-                    if original_line != current_line:
-                        line_start = f"{i+1}.0"
-                        line_end = f"{i+1}.end"
-                        if (text_widget.compare(line_start, "<=", "end") and
-                            text_widget.compare(line_end, "<=", "end")):
-                            text_widget.tag_add("user_edit", line_start, line_end)
+            if current_content is None:
+                current_content = text_widget.get("1.0", "end-1c")
+            if current_content == original_content:
+                return
+            
+            # 按差异块高亮，插入或删除行不会让后面所有行都被标为变更；
+            # 范围都来自当前内容的行号，无需再用compare检查
+            ranges = find_changed_line_ranges(get_original_lines(), current_content.split('\n'))
+            if ranges:
+                text_widget.tag_add("user_edit", *ranges)
         
         self._detect_and_highlight_changes = detect_and_highlight_changes
         
@@ -358,27 +395,30 @@ class SaveFileViewer:
                 self.search_handler.clear_search()
             
             if disable_collapse_var.get():
-                full_json = json.dumps(self.save_data, ensure_ascii=False, indent=2)
+                full_json = self._get_full_json()
                 text_widget.delete("1.0", "end")
                 text_widget.insert("1.0", full_json)
-                apply_json_syntax_highlight(text_widget, full_json)
+                self.json_highlighter.set_content(full_json)
                 original_content = full_json
                 collapsed_text_ranges.clear()
             else:
                 formatted_json = self.json_formatter.format_display_data(self.save_data)
                 text_widget.delete("1.0", "end")
                 text_widget.insert("1.0", formatted_json)
-                apply_json_syntax_highlight(text_widget, formatted_json)
+                self.json_highlighter.set_content(formatted_json)
                 original_content = formatted_json
-                update_collapsed_ranges()
+                update_collapsed_ranges(formatted_json)
             
             self._update_line_numbers(text_widget, self.line_numbers)
+            # 程序重新写入的内容不算用户修改
+            text_widget.edit_modified(False)
             
             if enable_edit_var.get():
                 text_widget.config(state="normal")
                 if self.save_button:
                     self.save_button.config(state="normal")
-                detect_and_highlight_changes()
+                # 刚写入的内容就是original_content，无需再从widget读取
+                detect_and_highlight_changes(original_content)
             else:
                 text_widget.config(state="disabled")
                 if self.save_button:
@@ -558,6 +598,10 @@ class SaveFileViewer:
         def save_save_file() -> None:
             nonlocal original_content
             
+            # 后台写入进行中，保持编辑器禁用，避免写入完成后的刷新覆盖新输入
+            if self._save_in_progress:
+                return
+            
             text_widget.config(state="normal")
             content = _get_current_text_content()
             
@@ -707,6 +751,9 @@ class SaveFileViewer:
         get_current_text_content: Callable[[], str]
     ) -> None:
         """保存到文件"""
+        if self._save_in_progress:
+            return
+        
         user_confirmed = messagebox.askyesno(
             self.t("save_confirm_title"),
             self.t("save_confirm_text"),
@@ -754,33 +801,67 @@ class SaveFileViewer:
                 text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
             return
         
-        # 默认保存逻辑：保存到 DevilConnection_sf.sav
+        # 默认保存逻辑：在共享线程池中序列化、编码并写入 DevilConnection_sf.sav，
+        # 写入期间禁止编辑，完成后回到UI线程更新界面
         save_file_path = Path(self.storage_dir) / SAVE_FILE_NAME
-        json_str = json.dumps(edited_data, ensure_ascii=False)
-        encoded_content = urllib.parse.quote(json_str)
+        self._save_in_progress = True
+        text_widget.config(state="disabled")
+        if self.save_button:
+            self.save_button.config(state="disabled")
         
-        try:
-            with open(save_file_path, 'w', encoding='utf-8') as file_handle:
-                file_handle.write(encoded_content)
-        except (OSError, IOError, PermissionError) as file_error:
-            showerror_relative(
-                self.viewer_window,
-                self.t("error"),
-                self.t("save_file_failed").format(error=str(file_error))
-            )
-            text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
+        def write_in_thread():
+            save_error: Optional[Exception] = None
+            try:
+                write_encoded_save(save_file_path, edited_data)
+            except Exception as e:
+                logger.error(f"Failed to save file: {e}", exc_info=True)
+                save_error = e
+            self.viewer_window.after(0, lambda: self._on_file_saved(
+                edited_data,
+                save_error,
+                enable_edit_var,
+                text_widget,
+                update_display
+            ))
+        
+        submit_blocking(write_in_thread)
+    
+    def _on_file_saved(
+        self,
+        edited_data: Dict[str, Any],
+        save_error: Optional[Exception],
+        enable_edit_var: tk.BooleanVar,
+        text_widget: tk.Text,
+        update_display: Callable
+    ) -> None:
+        """后台写入存档文件完成后的回调（在UI线程中执行）"""
+        self._save_in_progress = False
+        # 写入期间窗口可能已被关闭，此时只更新数据和调用回调
+        window_exists = text_widget.winfo_exists()
+        if window_exists and self.save_button:
+            self.save_button.config(state="normal" if enable_edit_var.get() else "disabled")
+        
+        if save_error is not None:
+            if window_exists:
+                showerror_relative(
+                    self.viewer_window,
+                    self.t("error"),
+                    self.t("save_file_failed").format(error=str(save_error))
+                )
+                text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
             return
         
         self.save_data = edited_data
         self.original_save_data = self._deep_copy_data(edited_data)
         self._data_was_saved = True
-        showinfo_relative(
-            self.viewer_window,
-            self.t("success"),
-            self.t("save_success")
-        )
-        update_display()
-        text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
+        if window_exists:
+            showinfo_relative(
+                self.viewer_window,
+                self.t("success"),
+                self.t("save_success")
+            )
+            update_display()
+            text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
         
         # 调用保存回调
         if self.viewer_config and self.viewer_config.on_save_callback:
@@ -862,33 +943,30 @@ class SaveFileViewer:
         original_content_ref: list
     ) -> None:
         """异步检查变更并执行注入"""
-        def check_and_inject_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                has_changes, changes_info = loop.run_until_complete(
-                    self.viewer_config.service.check_sf_changes(
-                        self.viewer_config.ws_url,
-                        self.original_save_data
-                    )
-                )
-                changes_text = changes_info.get("changes_text", "") if has_changes else ""
-                self.viewer_window.after(0, lambda: self._handle_changes_and_inject(
-                    has_changes,
-                    changes_text,
-                    edited_data,
-                    content,
-                    enable_edit_var,
-                    text_widget,
-                    update_display,
-                    get_current_text_content,
-                    original_content_ref
-                ))
-            finally:
-                loop.close()
+        def on_check_done(result: Any, exception: Optional[BaseException]) -> None:
+            if exception is not None:
+                logger.error(f"Error checking sf changes: {exception}", exc_info=exception)
+                text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
+                return
+            has_changes, changes_info = result
+            changes_text = changes_info.get("changes_text", "") if has_changes else ""
+            self._handle_changes_and_inject(
+                has_changes,
+                changes_text,
+                edited_data,
+                content,
+                enable_edit_var,
+                text_widget,
+                update_display,
+                get_current_text_content,
+                original_content_ref
+            )
         
-        thread = threading.Thread(target=check_and_inject_in_thread, daemon=True)
-        thread.start()
+        check_coro = self.viewer_config.service.check_sf_changes(
+            self.viewer_config.ws_url,
+            self.original_save_data
+        )
+        run_coroutine_for_window(self.viewer_window, check_coro, on_check_done)
     
     def _handle_changes_and_inject(
         self,
@@ -913,32 +991,25 @@ class SaveFileViewer:
                 text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
                 return
         
-        def inject_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                success, error = loop.run_until_complete(
-                    self.viewer_config.service.inject_and_save_sf(
-                        self.viewer_config.ws_url,
-                        edited_data
-                    )
-                )
-                self.viewer_window.after(0, lambda: self._on_inject_complete(
-                    success,
-                    error,
-                    edited_data,
-                    content,
-                    enable_edit_var,
-                    text_widget,
-                    update_display,
-                    get_current_text_content,
-                    original_content_ref
-                ))
-            finally:
-                loop.close()
+        inject_coro = self.viewer_config.service.inject_and_save_sf(
+            self.viewer_config.ws_url,
+            edited_data
+        )
+        
+        def on_complete(success: bool, error: Optional[str]) -> None:
+            self._on_inject_complete(
+                success,
+                error,
+                edited_data,
+                content,
+                enable_edit_var,
+                text_widget,
+                update_display,
+                get_current_text_content,
+                original_content_ref
+            )
         
-        thread = threading.Thread(target=inject_in_thread, daemon=True)
-        thread.start()
+        self._run_async(inject_coro, on_complete)
     
     def _on_inject_complete(
         self,
@@ -1001,30 +1072,22 @@ class SaveFileViewer:
         original_content_ref: list
     ) -> None:
         """注入后刷新数据"""
-        def read_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                data, read_error = loop.run_until_complete(
-                    self.viewer_config.service.read_tyrano_variable_sf(
-                        self.viewer_config.ws_url
-                    )
-                )
-                self.viewer_window.after(0, lambda: self._on_refresh_complete(
-                    data,
-                    read_error,
-                    enable_edit_var,
-                    text_widget,
-                    update_display,
-                    get_current_text_content,
-                    original_content_ref
-                ))
-            finally:
-                loop.close()
+        def on_complete(data: Optional[Dict[str, Any]], read_error: Optional[str]) -> None:
+            self._on_refresh_complete(
+                data,
+                read_error,
+                enable_edit_var,
+                text_widget,
+                update_display,
+                get_current_text_content,
+                original_content_ref
+            )
         
         def start_refresh():
-            thread = threading.Thread(target=read_in_thread, daemon=True)
-            thread.start()
+            read_coro = self.viewer_config.service.read_tyrano_variable_sf(
+                self.viewer_config.ws_url
+            )
+            self._run_async(read_coro, on_complete)
         
         self.viewer_window.after(REFRESH_AFTER_INJECT_DELAY_MS, start_refresh)
     
@@ -1052,34 +1115,21 @@ class SaveFileViewer:
         update_display()
         text_widget.config(state="normal" if enable_edit_var.get() else "disabled")
     
-    def _run_async_in_thread(
+    def _run_async(
         self,
-        coro: Awaitable[Tuple[Any, Optional[str]]],
+        coro: Coroutine[Any, Any, Tuple[Any, Optional[str]]],
         on_complete: Callable[[Any, Optional[str]], None]
     ) -> None:
-        """在后台线程中运行异步协程"""
-        def run_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result, error = loop.run_until_complete(coro)
-                self.viewer_window.after(0, lambda: on_complete(result, error))
-            except Exception as e:
-                logger.exception("Unexpected error in async thread")
-                self.viewer_window.after(0, lambda: on_complete(None, str(e)))
-            finally:
-                pending = asyncio.all_tasks(loop)
-                if pending:
-                    for task in pending:
-                        task.cancel()
-                    try:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                    except Exception as gather_error:
-                        logger.debug("Error gathering pending tasks: %s", gather_error)
-                loop.close()
-        
-        thread = threading.Thread(target=run_in_thread, daemon=True)
-        thread.start()
+        """在后台事件循环中运行异步协程，完成后在主线程中回调"""
+        def on_done(result: Any, exception: Optional[BaseException]) -> None:
+            if exception is not None:
+                logger.error("Unexpected error in async task", exc_info=exception)
+                on_complete(None, str(exception))
+                return
+            value, error = result
+            on_complete(value, error)
+        
+        run_coroutine_for_window(self.viewer_window, coro, on_done)
     
     def _inject_kag_stat_async(
         self,
@@ -1114,7 +1164,7 @@ class SaveFileViewer:
                 original_content_ref
             )
         
-        self._run_async_in_thread(inject_coro, on_complete)
+        self._run_async(inject_coro, on_complete)
     
     def _on_kag_stat_inject_complete(
         self,
@@ -1206,7 +1256,7 @@ class SaveFileViewer:
             )
         
         def start_refresh():
-            self._run_async_in_thread(read_coro, on_complete)
+            self._run_async(read_coro, on_complete)
         
         self.viewer_window.after(REFRESH_AFTER_INJECT_DELAY_MS, start_refresh)
     
@@ -210,9 +210,9 @@ def add_info_line(
             label_widget = widget_info.get('label_widget')
             
             if value_widget and value_widget.winfo_exists():
-                # 使用StringVar进行自动更新
-                widget_manager.update_string_var(widget_key, str(value))
-                widget_manager.update_label_var(widget_key, f"{label}:")
+                # 直接写入绑定的StringVar，由Tk的变量跟踪刷新显示
+                widget_info['value_var'].set(str(value))
+                widget_info['label_var'].set(f"{label}:")
                 return value_widget
             else:
                 # widget已无效，从映射中删除
@@ -299,7 +299,9 @@ def add_info_line(
             'value_widget': value_widget,
             'label_widget': label_widget,
             'line_frame': line_frame,
-            'var_name_widget': var_name_widget
+            'var_name_widget': var_name_widget,
+            'value_var': value_var,
+            'label_var': label_var
         })
     
     return value_widget
@@ -311,7 +313,7 @@ def add_list_info(
     items: List[Any],
     cached_width: int,
     translation_func: Callable[[str], str]
-) -> None:
+) -> tk.Frame:
     """添加列表信息，显示完整列表
     
     Args:
@@ -320,6 +322,9 @@ def add_list_info(
         items: 要显示的列表项
         cached_width: 缓存的宽度值
         translation_func: 翻译函数
+        
+    Returns:
+        列表行的frame容器
     """
     line_frame = tk.Frame(parent, bg=DEFAULT_BG_COLOR)
     line_frame.pack(fill="x", padx=5, pady=2)
@@ -353,6 +358,7 @@ def add_list_info(
             justify="left"
         )
     value_widget.pack(side="left", padx=5, fill="x", expand=True)
+    return line_frame
 
 
 def add_list_info_horizontal(
@@ -471,9 +477,12 @@ def add_info_line_with_tooltip(
             tooltip_text_widget = widget_info.get('tooltip_text_widget')
             
             if value_widget and value_widget.winfo_exists():
-                widget_manager.update_string_var(widget_key, str(value))
-                widget_manager.update_label_var(widget_key, f"{label}:")
-                widget_manager.update_tooltip_var(widget_key, tooltip_text)
+                widget_info['value_var'].set(str(value))
+                widget_info['label_var'].set(f"{label}:")
+                # 以普通信息行创建的widget没有tooltip变量
+                tooltip_var = widget_info.get('tooltip_var')
+                if tooltip_var is not None:
+                    tooltip_var.set(tooltip_text)
                 
                 if text_color:
                     if label_widget:
@@ -608,7 +617,10 @@ def add_info_line_with_tooltip(
             'container': container,
             'line_frame': line_frame,
             'var_name_widget': var_name_widget,
-            'tooltip_text_widget': tooltip_text_widget
+            'tooltip_text_widget': tooltip_text_widget,
+            'value_var': value_var,
+            'label_var': label_var,
+            'tooltip_var': tooltip_var
         })
     
     return value_widget
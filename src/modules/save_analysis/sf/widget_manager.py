@@ -28,6 +28,8 @@ class WidgetManager:
         self._string_vars: Dict[str, tk.StringVar] = {}
         self._label_vars: Dict[str, tk.StringVar] = {}
         self._tooltip_vars: Dict[str, tk.StringVar] = {}
+        self._section_labels: Dict[str, Tuple[tk.Widget, ...]] = {}
+        self._list_widgets: Dict[str, tk.Widget] = {}
     
     def toggle_var_names_display(self) -> None:
         """切换变量名显示状态"""
@@ -99,6 +101,8 @@ class WidgetManager:
             section_widget: section widget
         """
         self._section_map[section_key] = section_widget
+        # section重建后之前收集的Label已失效
+        self._section_labels.pop(section_key, None)
     
     def get_section(self, section_key: str) -> Optional[tk.Widget]:
         """获取section widget
@@ -111,6 +115,26 @@ class WidgetManager:
         """
         return self._section_map.get(section_key)
     
+    def cache_section_labels(self, section_key: str, labels: Tuple[tk.Widget, ...]) -> None:
+        """缓存section内的Label列表
+        
+        Args:
+            section_key: section的唯一标识键
+            labels: section内的Label widget元组
+        """
+        self._section_labels[section_key] = labels
+    
+    def get_section_labels(self, section_key: str) -> Optional[Tuple[tk.Widget, ...]]:
+        """获取缓存的section内Label列表
+        
+        Args:
+            section_key: section的唯一标识键
+            
+        Returns:
+            Label widget元组，如果未缓存则返回None
+        """
+        return self._section_labels.get(section_key)
+    
     def register_dynamic_widget(
         self,
         widget_key: str,
@@ -135,6 +159,26 @@ class WidgetManager:
         """
         return self._dynamic_widgets.get(widget_key)
     
+    def register_list_widget(self, widget_key: str, list_widget: tk.Widget) -> None:
+        """注册动态列表widget
+        
+        Args:
+            widget_key: widget的唯一标识键
+            list_widget: 列表行的frame容器
+        """
+        self._list_widgets[widget_key] = list_widget
+    
+    def get_list_widget(self, widget_key: str) -> Optional[tk.Widget]:
+        """获取动态列表widget
+        
+        Args:
+            widget_key: widget的唯一标识键
+            
+        Returns:
+            列表行的frame容器，如果不存在则返回None
+        """
+        return self._list_widgets.get(widget_key)
+    
     def register_section_title(
         self,
         title_key: str,
@@ -243,7 +287,9 @@ class WidgetManager:
         """清除所有widget映射和状态"""
         self._widget_map.clear()
         self._section_map.clear()
+        self._section_labels.clear()
         self._dynamic_widgets.clear()
+        self._list_widgets.clear()
         self._section_title_widgets.clear()
         self.var_name_widgets.clear()
         self._string_vars.clear()
@@ -270,6 +316,7 @@ class WidgetManager:
         
         for section_key in invalid_section_keys:
             self._section_map.pop(section_key, None)
+            self._section_labels.pop(section_key, None)
         
         invalid_hint_indices: List[int] = []
         for idx, hint_info in enumerate(self._hint_labels):
@@ -61,8 +61,12 @@ def get_cjk_font(size: int = 10, weight: str = "normal") -> Tuple[str, int, ...]
 # 等宽字体（代码/行号）
 # =====================================================
 
+# 缓存等宽字体元组，键为缩放后的字号
+_MONO_FONT_CACHE: Dict[int, Tuple[str, int]] = {}
+
+
 def get_mono_font(size: int = 10) -> Tuple[str, int]:
-    """获取跨平台等宽字体
+    """获取跨平台等宽字体（带缓存）
     
     Args:
         size: 字体大小，默认10
@@ -72,19 +76,20 @@ def get_mono_font(size: int = 10) -> Tuple[str, int]:
     """
     scaled_size = max(1, int(round(size * _FONT_SCALE)))
     
+    if scaled_size in _MONO_FONT_CACHE:
+        return _MONO_FONT_CACHE[scaled_size]
+    
     system_name = platform.system()
     if system_name == "Windows":
-        return ("Consolas", scaled_size)
+        font_tuple = ("Consolas", scaled_size)
     elif system_name == "Darwin":
-        return ("Monaco", scaled_size)
+        font_tuple = ("Monaco", scaled_size)
     else:
         # Linux 和其他系统
-        try:
-            return ("DejaVu Sans Mono", scaled_size)
-        except (OSError, AttributeError):
-            # 如果字体不可用，回退到 Courier
-            logger.debug("DejaVu Sans Mono not available, falling back to Courier")
-            return ("Courier", scaled_size)
+        font_tuple = ("DejaVu Sans Mono", scaled_size)
+    
+    _MONO_FONT_CACHE[scaled_size] = font_tuple
+    return font_tuple
 
 
 # =====================================================